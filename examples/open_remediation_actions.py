@@ -2,7 +2,7 @@ import sys
 import datetime
 import argparse
 import getpass
-from pyexclient.workbench import WorkbenchClient, relationship, neq, window
+from pyexclient.workbench import WorkbenchClient, neq, window
 
 
 def make_wb_client(username=None, api_token=None):
@@ -17,9 +17,10 @@ def make_wb_client(username=None, api_token=None):
         return WorkbenchClient('https://workbench.expel.io',
                     username=username,
                     password=getpass.getpass("Please enter your password: "),
-                    mfa_code=input("Please enter your MFA token: "))
+                    mfa_code=input("Please enter your MFA token: "),
+                    typed=True)
 
-    return WorkbenchClient('https://workbench.expel.io', token=api_token)
+    return WorkbenchClient('https://workbench.expel.io', token=api_token, typed=True)
 
 
 def main():
@@ -43,17 +44,21 @@ def main():
 
     # Search remediation actions where the status is not equal to CLOSED or COMPLETED, and optionally it was created within the window of start_date and end_date.
     # start and end date's can be None in which case the search will look at all remediation actions.
-    for rem in xc.remediation_actions.search(created_at=window(start_date, end_date), status=neq('COMPLETED', 'CLOSED')):
-        # Calculate the number of days since the remediation action was created.
-        since = (datetime.datetime.now() - datetime.datetime.strptime(rem.created_at, "%Y-%m-%dT%H:%M:%S.%fZ")).days
+    rems = list(xc.remediation_actions.search(created_at=window(start_date, end_date), status=neq('COMPLETED', 'CLOSED')))
+
+    # Fetch the assets of all the remediation actions, several remediation actions at once, grouped by remediation action id.
+    assets = xc.remediation_action_assets.children_of(rems, 'remediation_action')
+
+    for rem in rems:
+        # Calculate the number of days since the remediation action was created, a typed client returns created_at as a datetime.
+        since = (datetime.datetime.now(datetime.timezone.utc) - rem.created_at).days
         print(f'{rem.action} created {rem.created_at} ({since} days ago) has status {rem.status} and the comment is "{rem.comment if rem.comment else ""}"')
 
         # Count the number of assets we have
-        count = xc.remediation_action_assets.search(relationship('remediation_action.id', rem.id)).count()
-        print(f'Found {count} remediation action assets for remediation action {rem.id}')
+        print(f'Found {len(assets[rem.id])} remediation action assets for remediation action {rem.id}')
 
         # Now print all the assets we have for the parent action
-        for asset in xc.remediation_action_assets.search(relationship('remediation_action.id', rem.id)):
+        for asset in assets[rem.id]:
             print(f'\t{asset.status} - {asset.asset_type} - {asset.value}')
     # End documentation snippet
 
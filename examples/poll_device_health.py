@@ -18,6 +18,7 @@ from pyexclient import WorkbenchClient
 from pyexclient.workbench import neq 
 from pyexclient.workbench import gt
 from pyexclient.workbench import flag
+from pyexclient.workbench import param
 
 
 def authenticate():
@@ -34,11 +35,14 @@ def authenticate():
 def main():
     xc = authenticate()
 
+    # Compile the search once, each poll only binds the new start time.
+    unhealthy = xc.security_devices.prepare(status_updated_at=gt(param('since')), status=neq('healthy'), raw_status=flag('true'))
+
     while True:
         since = datetime.now() - timedelta(minutes=5)
         print("Querying device status since: {since}".format(since=since))
 
-        devices = [dev for dev in xc.security_devices.search(status_updated_at=gt(since.isoformat()), status=neq('healthy'), raw_status=flag('true'))]
+        devices = [dev for dev in unhealthy.search(since=since)]
         if not devices:
             print("\tNo unhealthy devices found")
         else:
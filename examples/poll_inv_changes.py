@@ -36,10 +36,11 @@ def get_inv_changes(xc, since):
     '''
 
     for change in xc.investigative_action_histories.search(relationship('investigation.id', notnull()), created_at=gt(since.isoformat()) ):
-        if change.investigation is None:
+        investigation_id = change.rel_id('investigation')
+        if investigation_id is None:
             print("Skipping ... due to expel alert")
             continue
-        entry = {'action': change.action, 'value': change.value, 'investigation_id': change.investigation.id}
+        entry = {'action': change.action, 'value': change.value, 'investigation_id': investigation_id}
         if change.action == 'ASSIGNED':
             entry['assigned_to_actor'] = change.assigned_to_actor.display_name
         yield entry
@@ -50,7 +51,7 @@ def get_inv_changes(xc, since):
                 'updated_at': change.updated_at, 
                 'updated_by': change.updated_by.display_name, 
                 'value': change.value, 
-                'investigation_id': change.investigation.id}
+                'investigation_id': change.rel_id('investigation')}
         yield entry
 
     for change in xc.investigation_histories.search(created_at=gt(since.isoformat())):
@@ -59,7 +60,7 @@ def get_inv_changes(xc, since):
                 'created_by': change.created_by.display_name, 
                 'assigned_to_actor': change.assigned_to_actor.display_name, 
                 'value': change.value, 
-                'investigation_id': change.investigation.id}
+                'investigation_id': change.rel_id('investigation')}
         yield entry
 
 def main():
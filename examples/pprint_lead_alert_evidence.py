@@ -11,6 +11,7 @@ import sys
 import getpass
 
 from pyexclient import WorkbenchClient
+from pyexclient.evidence import EvidenceFlattener
 
 
 def authenticate():
@@ -23,27 +24,6 @@ def authenticate():
     xc = WorkbenchClient('https://workbench.expel.io', username=username, password=password, mfa_code=code)
     return xc
 
-def flatten_dict(blob):
-    '''
-    Flattens a nested dict.
-
-    >>> print(flatten_dict({"a": "b", "c":['a', 'b', {'d':'e'}]}))
-    >>> {'a': 'b', 'c.0': 'a', 'c.1': 'b', 'c.2.d': 'e'}
-    '''
-    out = {}
-    def _make_flat(elms, name=''):
-        if type(elms) is dict:
-            for elm in elms:
-                _make_flat(elms[elm], name + elm + '.')
-        elif type(elms) is list:
-            for i, elm in enumerate(elms):
-                _make_flat(elm, name + str(i) + '.')
-        else:
-            out[name[:-1]] = elms
-
-    _make_flat(blob)
-    return out
-
 def make_evidence_dict(ea):
     '''
     This method will take an ExpelAlert and iterate over vendor alerts,
@@ -58,6 +38,7 @@ def make_evidence_dict(ea):
         >>> vendor_evidences = make_evidence_dict(xc.expel_alerts.get(id='ea52123b-383f-4a3b-aa7b-45658a0ce873'))
 
     '''
+    flattener = EvidenceFlattener()
     vendor_evidences = []
     for va in ea.vendor_alerts:
         ev_dict = {}
@@ -66,16 +47,11 @@ def make_evidence_dict(ea):
         ev_dict['message'] = va.vendor_message
         ev_dict['evidence'] = {}
 
-        for evidence in va.evidence_summary:
-            # Skip empty evidence..
-            for evidence in va.evidence_summary:
-                for evidence_type in evidence.keys():
-                    flat_ev = flatten_dict(evidence[evidence_type])
-                    if evidence_type not in ev_dict['evidence']:
-                        ev_dict['evidence'][evidence_type] = {}
-                    # NOTE: this is because evidence_source is top level key and so when we flatten and pull out evidence type (in this case evidence_source)
-                    # our key value pair, has an empty key. This is a side effect of flattening out the evidence.
-                    ev_dict['evidence'][evidence_type].update({k if k else evidence_type: v for k,v in flat_ev.items()})
+        # Flattened paths start with the evidence type, e.g. process.parent.name
+        for path, value in flattener.flatten_evidence(va.evidence_summary).items():
+            evidence_type, _, field = path.partition('.')
+            # NOTE: top level keys like evidence_source have no field below the evidence type, so key them by the type itself.
+            ev_dict['evidence'].setdefault(evidence_type, {})[field or evidence_type] = value
         vendor_evidences.append(ev_dict)
     return vendor_evidences
 
@@ -0,0 +1,205 @@
+#!/usr/bin/env python
+'''
+Token providers supply the bearer token a client authenticates with. A provider that knows how to get a new token lets
+long running jobs outlive any one token: it refreshes shortly before the current token expires, while requests in
+flight keep using the still valid old one, and the client retries a request once with a fresh token if it is rejected
+with a 401.
+
+Examples:
+    >>> def fetch():
+    >>>     resp = requests.post(vault_url, ...).json()
+    >>>     return resp['token'], resp['expires_in']
+    >>> xc = WorkbenchClient('https://workbench.expel.io', token_provider=CallbackTokenProvider(fetch))
+'''
+import base64
+import binascii
+import json
+import logging
+import threading
+import time
+
+
+logger = logging.getLogger(__name__)
+
+
+def bearer(token):
+    if token and not token.startswith('Bearer'):
+        return 'Bearer %s' % token
+    return token
+
+
+def token_expiry(token):
+    '''
+    Read the expiry time from a JWT without verifying it.
+
+    :param token: The token, with or without the ``Bearer`` prefix.
+    :type token: str
+    :return: Expiry as seconds since the epoch, or None if the token is not a JWT with an ``exp`` claim.
+    :rtype: float or None
+    '''
+    if token.startswith('Bearer '):
+        token = token[len('Bearer '):]
+    parts = token.split('.')
+    if len(parts) != 3:
+        return None
+    try:
+        payload = json.loads(base64.urlsafe_b64decode(parts[1] + '=' * (-len(parts[1]) % 4)))
+    except (ValueError, binascii.Error):
+        return None
+    exp = payload.get('exp') if isinstance(payload, dict) else None
+    return float(exp) if isinstance(exp, (int, float)) else None
+
+
+class TokenProvider:
+    '''
+    Base class of token providers. Subclasses implement :meth:`fetch`.
+
+    The current token is swapped atomically. When it is within ``refresh_margin`` seconds of expiring one caller
+    fetches a new token while every other caller keeps getting the current one, callers only wait when there is no
+    usable token at all.
+
+    :param refresh_margin: Seconds before expiry at which the token is refreshed.
+    :type refresh_margin: float
+    '''
+
+    def __init__(self, refresh_margin=60):
+        self.refresh_margin = refresh_margin
+        self.refreshes = 0
+        self._token = None
+        self._expires_at = None
+        self._refreshing = False
+        self._cond = threading.Condition()
+
+    def __getstate__(self):
+        state = dict(self.__dict__)
+        del state['_cond']
+        state['_refreshing'] = False
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._cond = threading.Condition()
+
+    def fetch(self):
+        '''
+        Get a new token.
+
+        :return: The token and its lifetime in seconds, the lifetime is read from the token when it is a JWT if None.
+        :rtype: tuple
+        '''
+        raise NotImplementedError()
+
+    def _expired(self, now, margin=0):
+        return self._expires_at is not None and now >= self._expires_at - margin
+
+    def _refresh(self):
+        try:
+            token, expires_in = self.fetch()
+            token = bearer(token)
+            if expires_in is not None:
+                expires_at = time.time() + expires_in
+            else:
+                expires_at = token_expiry(token)
+        except Exception:
+            with self._cond:
+                self._refreshing = False
+                self._cond.notify_all()
+            raise
+
+        with self._cond:
+            self._token = token
+            self._expires_at = expires_at
+            self._refreshing = False
+            self.refreshes += 1
+            self._cond.notify_all()
+        logger.debug('Refreshed token, expires at %s', expires_at)
+        return token
+
+    def authorization(self):
+        '''
+        :return: The ``Authorization`` header value to send.
+        :rtype: str
+        '''
+        with self._cond:
+            now = time.time()
+            usable = self._token is not None and not self._expired(now)
+            if usable and not self._expired(now, self.refresh_margin):
+                return self._token
+            if self._refreshing:
+                if usable:
+                    return self._token
+                while self._refreshing:
+                    self._cond.wait()
+                if self._token is not None and not self._expired(time.time()):
+                    return self._token
+            self._refreshing = True
+            current = self._token if self._token is not None and not self._expired(time.time()) else None
+        try:
+            return self._refresh()
+        except Exception as e:
+            # A failed proactive refresh is retried on a later call, the current token is still good until it expires
+            if current is None or self._expired(time.time()):
+                raise
+            logger.warning('Failed to refresh token, using the current one until it expires: %s', e)
+            return current
+
+    def invalidate(self, rejected):
+        '''
+        Called when Workbench rejected a token. Refreshes it unless another caller already has.
+
+        :param rejected: The ``Authorization`` header value that was rejected.
+        :type rejected: str
+        :return: True if a different token is now available and the request is worth retrying.
+        :rtype: bool
+        '''
+        with self._cond:
+            while self._refreshing:
+                self._cond.wait()
+            if self._token != rejected:
+                return self._token is not None
+            self._refreshing = True
+        try:
+            return self._refresh() != rejected
+        except Exception as e:
+            logger.warning('Failed to refresh rejected token: %s', e)
+            return False
+
+
+class StaticTokenProvider(TokenProvider):
+    '''
+    A token that is never refreshed, the behaviour of passing ``token`` to the client.
+
+    :param token: The bearer token.
+    :type token: str
+    '''
+
+    def __init__(self, token):
+        super().__init__(refresh_margin=0)
+        self._token = bearer(token)
+
+    def authorization(self):
+        return self._token
+
+    def invalidate(self, rejected):
+        return False
+
+
+class CallbackTokenProvider(TokenProvider):
+    '''
+    Tokens from a callable, e.g. one reading an API key from a secrets store.
+
+    :param callback: Returns a token, or a ``(token, expires_in)`` tuple.
+    :type callback: callable
+    :param refresh_margin: Seconds before expiry at which the token is refreshed.
+    :type refresh_margin: float
+    '''
+
+    def __init__(self, callback, refresh_margin=60):
+        super().__init__(refresh_margin=refresh_margin)
+        self.callback = callback
+
+    def fetch(self):
+        result = self.callback()
+        if isinstance(result, tuple):
+            return result
+        return result, None
@@ -0,0 +1,290 @@
+#!/usr/bin/env python
+'''
+Backfill a resource type's records over a long date range, e.g. a year of ``expel_alert_histories``. The range is
+split into time window shards, shards holding more than ``max_shard`` records are split again, and the shards are
+fetched concurrently into one NDJSON file each. A checkpoint records the shards that are done, so an interrupted
+backfill picks up where it left off.
+
+Examples:
+    >>> backfill = Backfill(xc.expel_alert_histories, datetime.datetime(2021, 1, 1), datetime.datetime(2022, 1, 1),
+    >>>                     'backfill/expel_alert_histories', workers=16)
+    >>> print(backfill.run())
+    {'shards': 412, 'records': 3190223, 'errors': 0}
+    >>> for record in backfill.records():
+    >>>     ...
+
+Or from the command line::
+
+    python -m pyexclient.backfill expel_alert_histories --start 2021-01-01 --end 2022-01-01 --out backfill
+'''
+import argparse
+import concurrent.futures
+import datetime
+import json
+import logging
+import os
+import sys
+import threading
+
+from .workbench import _json_default
+from .workbench import BaseResourceObject
+from .workbench import is_operator
+from .workbench import limit
+from .workbench import parse_timestamp
+from .workbench import window
+
+
+logger = logging.getLogger(__name__)
+
+CHECKPOINT = 'checkpoint.json'
+
+
+def _utc(value):
+    # Shard bounds are naive UTC datetimes
+    if isinstance(value, str):
+        parsed = parse_timestamp(value)
+        if parsed is None:
+            raise ValueError('Expected a timestamp, got %s' % value)
+        value = parsed
+    if value.tzinfo is not None:
+        value = value.astimezone(datetime.timezone.utc).replace(tzinfo=None)
+    return value
+
+
+def _filter_params(filters):
+    # The query params filters compile to, operators have no stable repr to tell two backfills apart by
+    params = []
+    for name, value in sorted(filters.items()):
+        if is_operator(value):
+            params.extend([key, str(cond)] for key, cond in value.create_query_filters(name))
+        else:
+            params.append(['filter[%s]' % name, json.dumps(value, default=_json_default)])
+    return params
+
+
+class Shard:
+    '''
+    A time window ``[start, end)`` of the backfill.
+    '''
+    __slots__ = ('start', 'end', 'count', 'records', 'done')
+
+    def __init__(self, start, end, count=None, records=None, done=False):
+        self.start = start
+        self.end = end
+        self.count = count
+        self.records = records
+        self.done = done
+
+    @property
+    def name(self):
+        return '%s-%s' % (self.start.strftime('%Y%m%dT%H%M%S%f'), self.end.strftime('%Y%m%dT%H%M%S%f'))
+
+    def window(self):
+        # Filters are exclusive at both ends, start 1ms early so records at start are in this shard and not the last
+        return window(self.start - datetime.timedelta(milliseconds=1), self.end)
+
+    def to_dict(self):
+        return {'start': self.start.isoformat(), 'end': self.end.isoformat(), 'count': self.count,
+                'records': self.records, 'done': self.done}
+
+    @classmethod
+    def from_dict(cls, entry):
+        return cls(datetime.datetime.fromisoformat(entry['start']), datetime.datetime.fromisoformat(entry['end']),
+                   entry['count'], entry['records'], entry['done'])
+
+
+class Backfill:
+    '''
+    Fetch every record of a resource type created in a date range, sharded by time window.
+
+    :param resource: The resource type to backfill, e.g. ``xc.expel_alert_histories``.
+    :type resource: BaseResourceObject
+    :param start: Start of the range, inclusive.
+    :type start: datetime.datetime or str
+    :param end: End of the range, exclusive.
+    :type end: datetime.datetime or str
+    :param directory: Directory the shards and the checkpoint are written to, created if it does not exist.
+    :type directory: str
+    :param field: The timestamp field the range is on.
+    :type field: str
+    :param max_shard: Shards counting more records than this are split in two.
+    :type max_shard: int
+    :param min_width: Shards are never split below this width, however many records they hold.
+    :type min_width: datetime.timedelta
+    :param workers: Maximum number of concurrent counts and shard fetches.
+    :type workers: int
+    :param filters: Fields and values, or operators, applied to every shard's search.
+    :type filters: dict or None
+    '''
+
+    def __init__(self, resource, start, end, directory, field='created_at', max_shard=10000,
+                 min_width=datetime.timedelta(minutes=1), workers=8, filters=None):
+        self.resource = resource
+        self.start = _utc(start)
+        self.end = _utc(end)
+        if self.end <= self.start:
+            raise ValueError('Backfill end must be after its start')
+        self.directory = directory
+        self.field = field
+        self.max_shard = max_shard
+        self.min_width = min_width
+        self.workers = workers
+        self.filters = filters or {}
+        self.shards = None
+        self.errors = {}
+        self._lock = threading.Lock()
+
+    @property
+    def checkpoint_path(self):
+        return os.path.join(self.directory, CHECKPOINT)
+
+    def _search(self):
+        return BaseResourceObject(self.resource.cls, conn=self.resource.conn)
+
+    def _count(self, shard):
+        return self._search().search(limit(0), **{self.field: shard.window()}, **self.filters).count()
+
+    def plan(self):
+        '''
+        Split the range into shards of at most ``max_shard`` records, counting candidate shards concurrently. A saved
+        plan for the same backfill is loaded instead.
+
+        :return: The shards, in time order.
+        :rtype: list
+        '''
+        if self.shards is not None:
+            return self.shards
+        if self._load_checkpoint():
+            return self.shards
+
+        shards = []
+        pending = [Shard(self.start, self.end)]
+        with concurrent.futures.ThreadPoolExecutor(max_workers=self.workers) as pool:
+            while pending:
+                split = []
+                for shard, count in zip(pending, pool.map(self._count, pending)):
+                    shard.count = count
+                    width = shard.end - shard.start
+                    if count > self.max_shard and width / 2 >= self.min_width:
+                        # Split on a whole millisecond, the resolution of Workbench timestamps
+                        mid = shard.start + datetime.timedelta(milliseconds=(width // 2) // datetime.timedelta(milliseconds=1))
+                        split.extend([Shard(shard.start, mid), Shard(mid, shard.end)])
+                    else:
+                        shards.append(shard)
+                pending = split
+        self.shards = sorted(shards, key=lambda shard: shard.start)
+        logger.info('Planned %d shards of %s', len(self.shards), self.resource.api_type)
+        os.makedirs(self.directory, exist_ok=True)
+        self._save_checkpoint()
+        return self.shards
+
+    def _settings(self):
+        return {'api_type': self.resource.api_type, 'field': self.field, 'start': self.start.isoformat(),
+                'end': self.end.isoformat(), 'filters': _filter_params(self.filters)}
+
+    def _load_checkpoint(self):
+        try:
+            with open(self.checkpoint_path) as fd:
+                checkpoint = json.load(fd)
+        except FileNotFoundError:
+            return False
+        if checkpoint['settings'] != self._settings():
+            raise ValueError('%s holds a different backfill: %s' % (self.directory, checkpoint['settings']))
+        self.shards = [Shard.from_dict(entry) for entry in checkpoint['shards']]
+        return True
+
+    def _save_checkpoint(self):
+        with self._lock:
+            checkpoint = {'settings': self._settings(), 'shards': [shard.to_dict() for shard in self.shards]}
+            tmp = self.checkpoint_path + '.tmp'
+            with open(tmp, 'w') as fd:
+                json.dump(checkpoint, fd, indent=1)
+            os.replace(tmp, self.checkpoint_path)
+
+    def shard_path(self, shard):
+        return os.path.join(self.directory, '%s.ndjson' % shard.name)
+
+    def _fetch(self, shard):
+        # Write to a temporary file and move it in place once complete, a shard file is never partially written
+        path = self.shard_path(shard)
+        tmp = path + '.tmp'
+        records = 0
+        with open(tmp, 'w') as fd:
+            for record in self._search().search(**{self.field: shard.window()}, **self.filters):
+                fd.write(json.dumps(record._data, default=_json_default, separators=(',', ':')) + '\n')
+                records += 1
+        os.replace(tmp, path)
+        return records
+
+    def run(self):
+        '''
+        Fetch every shard that isn't done yet. A shard that fails is recorded in :attr:`errors` and left for the next
+        run, the other shards carry on.
+
+        :return: The number of shards, the records written by all completed shards, and the number of failed shards.
+        :rtype: dict
+        '''
+        shards = self.plan()
+        self.errors = {}
+        todo = [shard for shard in shards if not shard.done]
+        with concurrent.futures.ThreadPoolExecutor(max_workers=self.workers) as pool:
+            futures = {pool.submit(self._fetch, shard): shard for shard in todo}
+            for future in concurrent.futures.as_completed(futures):
+                shard = futures[future]
+                try:
+                    shard.records = future.result()
+                except Exception as e:
+                    logger.warning('Shard %s of %s failed: %s', shard.name, self.resource.api_type, e)
+                    self.errors[shard.name] = e
+                    continue
+                shard.done = True
+                self._save_checkpoint()
+        return {'shards': len(shards), 'records': sum(shard.records or 0 for shard in shards if shard.done),
+                'errors': len(self.errors)}
+
+    def records(self):
+        '''
+        Read the records of the completed shards back, in shard order.
+
+        :return: JSON API resource objects.
+        :rtype: generator
+        '''
+        for shard in self.plan():
+            if not shard.done:
+                continue
+            with open(self.shard_path(shard)) as fd:
+                for line in fd:
+                    if line.strip():
+                        yield json.loads(line)
+
+
+def main(argv=None):
+    from .workbench import WorkbenchClient
+
+    parser = argparse.ArgumentParser(prog='python -m pyexclient.backfill',
+                                     description='Backfill a resource type over a date range into NDJSON shards.')
+    parser.add_argument('api_type', help='The resource type, e.g. expel_alert_histories')
+    parser.add_argument('--start', required=True, help='Start of the range, e.g. 2021-01-01')
+    parser.add_argument('--end', required=True, help='End of the range, exclusive')
+    parser.add_argument('--out', required=True, help='Output directory, a rerun resumes from its checkpoint')
+    parser.add_argument('--field', default='created_at', help='The timestamp field the range is on')
+    parser.add_argument('--max-shard', type=int, default=10000, help='Split shards holding more records than this')
+    parser.add_argument('--workers', type=int, default=8, help='Concurrent requests')
+    parser.add_argument('--base-url', default='https://workbench.expel.io')
+    parser.add_argument('--token', default=os.environ.get('WORKBENCH_TOKEN'),
+                        help='API token, defaults to the WORKBENCH_TOKEN environment variable')
+    args = parser.parse_args(argv)
+    if not args.token:
+        parser.error('an API token is required, pass --token or set WORKBENCH_TOKEN')
+
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s %(levelname)s %(message)s')
+    xc = WorkbenchClient(args.base_url, token=args.token)
+    backfill = Backfill(getattr(xc, args.api_type), args.start, args.end, os.path.join(args.out, args.api_type),
+                        field=args.field, max_shard=args.max_shard, workers=args.workers)
+    summary = backfill.run()
+    print(json.dumps(summary))
+    return 1 if summary['errors'] else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,270 @@
+#!/usr/bin/env python
+'''
+A local mirror of the records of one resource type that answers searches from memory. Searches take the same operators
+as :meth:`~pyexclient.workbench.BaseResourceObject.search` and are evaluated locally, using a sorted index for range
+filters on the field the mirror is windowed on. The API is only called when a search reaches outside the windows
+already fetched, or when they have gone stale.
+
+Examples:
+    >>> alerts = RecordCache(xc.expel_alerts, ttl=300)
+    >>> start = datetime.datetime.now() - datetime.timedelta(days=7)
+    >>> for severity in ('CRITICAL', 'HIGH', 'MEDIUM'):
+    >>>     # The first search fetches the week, the others are answered from memory
+    >>>     print(severity, alerts.count(created_at=gt(start), expel_severity=severity))
+'''
+import bisect
+import threading
+import time
+
+from .workbench import _comparable
+from .workbench import base_filter
+from .workbench import gt
+from .workbench import is_operator
+from .workbench import lt
+from .workbench import relationship
+from .workbench import window
+
+
+class RecordCache:
+    '''
+    Records of one resource type, mirrored from Workbench a time window at a time.
+
+    :param resource: The resource type to mirror, e.g. ``xc.expel_alerts``.
+    :type resource: BaseResourceObject
+    :param field: The sortable field windows are fetched on, and indexed.
+    :type field: str
+    :param ttl: Seconds a fetched window is fresh for, after which searches in it go to Workbench again. Never stale if
+        None.
+    :type ttl: float or None
+    '''
+
+    def __init__(self, resource, field='created_at', ttl=None):
+        self.resource = resource
+        self.field = field
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._records = {}
+        self._windows = []
+        self._indexes = {}
+        self._lock = threading.RLock()
+
+    def __len__(self):
+        return len(self._records)
+
+    def add(self, records):
+        '''
+        Add records to the mirror, replacing earlier copies of the same records.
+
+        :param records: Resource instances of the mirrored type.
+        :type records: iterable
+        :return: The number of records added.
+        :rtype: int
+        '''
+        count = 0
+        with self._lock:
+            for record in records:
+                self._records[record.id] = record
+                count += 1
+            if count:
+                self._indexes.clear()
+        return count
+
+    def sync(self, start=None, end=None):
+        '''
+        Fetch the records whose ``field`` is strictly between ``start`` and ``end``, all records if both are None.
+
+        :param start: Lower bound, unbounded if None.
+        :type start: str or datetime.datetime or None
+        :param end: Upper bound, unbounded if None.
+        :type end: str or datetime.datetime or None
+        :return: The number of records fetched.
+        :rtype: int
+        '''
+        if start is not None and end is not None:
+            op = window(start, end)
+        elif start is not None:
+            op = gt(start)
+        elif end is not None:
+            op = lt(end)
+        else:
+            op = None
+        records = self.resource.search(**({self.field: op} if op is not None else {}))
+        with self._lock:
+            count = self.add(records)
+            self._windows.append((_comparable(start), _comparable(end), False, time.monotonic()))
+        return count
+
+    def _sync_value(self, value):
+        # Fetch the records whose field equals value, a window is exclusive at both ends and can't hold just one value
+        records = self.resource.search(**{self.field: value})
+        with self._lock:
+            count = self.add(records)
+            point = _comparable(value)
+            self._windows.append((point, point, True, time.monotonic()))
+        return count
+
+    def _covered(self, start, end, inclusive=False):
+        now = time.monotonic()
+        for w_start, w_end, w_inclusive, fetched_at in self._windows:
+            if self.ttl is not None and now - fetched_at > self.ttl:
+                continue
+            try:
+                if w_inclusive:
+                    if inclusive and start == w_start:
+                        return True
+                    continue
+                # A window holds the values strictly between its bounds
+                if w_start is not None and (start is None or start < w_start or (inclusive and start == w_start)):
+                    continue
+                if w_end is not None and (end is None or end > w_end or (inclusive and end == w_end)):
+                    continue
+            except TypeError:
+                continue
+            return True
+        return False
+
+    def _index(self, field):
+        # Sorted (value, id) pairs of the records with a value, None if the values don't sort together
+        index = self._indexes.get(field)
+        if index is None and field not in self._indexes:
+            pairs = [(_comparable(self._value(record, field)), record_id) for record_id, record in self._records.items()]
+            try:
+                pairs = sorted(pair for pair in pairs if pair[0] is not None)
+            except TypeError:
+                index = None
+            else:
+                index = ([value for value, _ in pairs], [record_id for _, record_id in pairs])
+            self._indexes[field] = index
+        return index
+
+    @staticmethod
+    def _value(record, field):
+        if field == 'id':
+            return record.id
+        return record._attrs.get(field)
+
+    def _bounds(self, value):
+        # The range an operator or value on the windowed field limits it to, None for an unbounded side
+        if not is_operator(value):
+            value = _comparable(value)
+            return value, value, True
+        start = end = None
+        for cond in value.filter_value:
+            cond = str(cond)
+            bound = _comparable(cond[1:])
+            if cond[:1] == '>' and (start is None or bound > start):
+                start = bound
+            elif cond[:1] == '<' and (end is None or bound < end):
+                end = bound
+        return start, end, False
+
+    def _candidates(self, start, end, inclusive):
+        index = self._index(self.field)
+        if index is None:
+            return None
+        keys, ids = index
+        if keys and isinstance(keys[0], (int, float)) and not isinstance(keys[0], bool):
+            try:
+                start = float(start) if start is not None else None
+                end = float(end) if end is not None else None
+            except ValueError:
+                return []
+        lo, hi = 0, len(keys)
+        try:
+            if start is not None:
+                lo = (bisect.bisect_left if inclusive else bisect.bisect_right)(keys, start)
+            if end is not None:
+                hi = (bisect.bisect_right if inclusive else bisect.bisect_left)(keys, end)
+        except TypeError:
+            # Bounds that don't sort with the values, e.g. a string bound on timestamps, are checked record by record
+            return None
+        return [self._records[record_id] for record_id in ids[lo:hi]]
+
+    def _predicates(self, args, kwargs):
+        schema = self.resource.cls._schema
+        predicates = []
+        for rel in args:
+            if not isinstance(rel, relationship) or not rel.has_id or len(rel.rel_parts) != 1:
+                raise ValueError('Only relationship operators on a related id can be evaluated locally')
+            if rel.rel_parts[0] not in schema.relationships:
+                raise ValueError('%s has no relationship %s' % (schema.api_type, rel.rel_parts[0]))
+            op = rel.value if is_operator(rel.value) else base_filter(rel.value)
+            predicates.append(lambda record, name=rel.rel_parts[0], op=op: op.matches(record.rel_id(name)))
+
+        for field_name, field_value in kwargs.items():
+            if field_name != 'id' and field_name not in schema.attributes:
+                raise ValueError('%s has no attribute %s' % (schema.api_type, field_name))
+            if is_operator(field_value):
+                op = field_value
+            elif field_name == 'id':
+                # A list of ids matches any of them
+                ids = set(str(field_value).split(','))
+                predicates.append(lambda record, ids=ids: record.id in ids)
+                continue
+            else:
+                op = base_filter(field_value)
+            predicates.append(lambda record, field_name=field_name, op=op: op.matches(self._value(record, field_name)))
+        return predicates
+
+    def search(self, *args, **kwargs):
+        '''
+        Search the mirror. Records in a window that isn't mirrored yet, or has gone stale, are fetched first. A search
+        that doesn't bound ``field`` is answered by Workbench unless the whole type has been mirrored with :meth:`sync`.
+
+        :param args: Relationship operators on a related id, e.g. ``relationship('investigation.id', inv_id)``.
+        :type args: tuple
+        :param kwargs: Fields and values, or operators, to search on.
+        :type kwargs: dict
+        :return: The matching records, ordered by ``field`` then id.
+        :rtype: list
+
+        Examples:
+            >>> alerts = RecordCache(xc.expel_alerts)
+            >>> for ea in alerts.search(created_at=window(start, end), status='OPEN', expel_name=startswith('EDR')):
+            >>>     print(ea.expel_name)
+        '''
+        predicates = self._predicates(args, kwargs)
+        if self.field in kwargs:
+            start, end, inclusive = self._bounds(kwargs[self.field])
+        else:
+            start = end = None
+            inclusive = False
+
+        with self._lock:
+            if self._covered(start, end, inclusive):
+                self.hits += 1
+            elif inclusive:
+                self.misses += 1
+                self._sync_value(kwargs[self.field])
+            elif start is None and end is None:
+                # No window to fetch, Workbench answers the search rather than the whole type being mirrored
+                self.misses += 1
+                return sorted(self.resource.search(*args, **kwargs), key=self._sort_key)
+            else:
+                self.misses += 1
+                self.sync(start, end)
+
+            candidates = None
+            if start is not None or end is not None:
+                candidates = self._candidates(start, end, inclusive)
+            if candidates is None:
+                candidates = list(self._records.values())
+
+        matched = [record for record in candidates if all(predicate(record) for predicate in predicates)]
+        matched.sort(key=self._sort_key)
+        return matched
+
+    def _sort_key(self, record):
+        # Records without a value sort last, like the database sorts nulls in ascending order
+        value = _comparable(self._value(record, self.field))
+        return (value is None, value if value is not None else '', record.id)
+
+    def count(self, *args, **kwargs):
+        '''
+        Count the matching records, see :meth:`search`.
+
+        :return: The number of matching records.
+        :rtype: int
+        '''
+        return len(self.search(*args, **kwargs))
@@ -0,0 +1,162 @@
+#!/usr/bin/env python
+'''
+Record and replay of Workbench HTTP traffic. A :class:`Cassette` attached to a client in ``record`` mode captures every
+request/response pair, with credentials redacted, into a compact gzipped JSON lines file. In ``replay`` mode the client
+is served from that file instead of the network, either at full speed or with the recorded timings. This allows
+profiling and regression testing the client's CPU side (page decoding, resource instance construction, query building)
+on production shaped data without access to Workbench.
+
+Examples:
+    >>> with Cassette('alerts.jsonl.gz', mode='record') as cassette:
+    >>>     xc = WorkbenchClient('https://workbench.expel.io', token=token, cassette=cassette)
+    >>>     alerts = list(xc.expel_alerts.search(created_at=gt('2020-01-01')))
+
+    >>> with Cassette('alerts.jsonl.gz') as cassette:
+    >>>     xc = WorkbenchClient('https://workbench.expel.io', cassette=cassette)
+    >>>     alerts = list(xc.expel_alerts.search(created_at=gt('2020-01-01')))
+'''
+import base64
+import collections
+import gzip
+import json
+import threading
+import time
+from urllib.parse import parse_qsl
+from urllib.parse import urlencode
+from urllib.parse import urlsplit
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+
+REDACTED = 'REDACTED'
+REDACT_FIELDS = frozenset(['access_token', 'refresh_token', 'token', 'password', 'secret', 'api_key'])
+KEEP_HEADERS = frozenset(['content-type', 'content-range', 'retry-after'])
+
+
+class CassetteError(Exception):
+    '''
+    Raised when a replayed request has no recorded response left.
+    '''
+
+
+def _key(method, url):
+    # Cassettes are portable across hosts, match on the path and query only. Query params are sorted by name, so the
+    # same params encoded in another order match, while repeated params, e.g. several sorts, keep their order.
+    parts = urlsplit(url)
+    params = sorted(parse_qsl(parts.query, keep_blank_values=True), key=lambda param: param[0])
+    path = parts.path + ('?' + urlencode(params) if params else '')
+    return '%s %s' % (method.upper(), path)
+
+
+def redact(blob, fields=REDACT_FIELDS):
+    '''
+    Return a copy of a decoded JSON document with the values of any ``fields`` keys replaced.
+    '''
+    if isinstance(blob, dict):
+        return {k: REDACTED if k in fields else redact(v, fields) for k, v in blob.items()}
+    if isinstance(blob, list):
+        return [redact(v, fields) for v in blob]
+    return blob
+
+
+class Cassette:
+    '''
+    Recorded Workbench HTTP traffic.
+
+    :param path: File the interactions are stored in.
+    :type path: str
+    :param mode: ``record`` to capture traffic, ``replay`` to serve it back.
+    :type mode: str
+    :param realtime: When replaying, wait out the recorded response time of each request.
+    :type realtime: bool
+    :param redact_fields: JSON keys whose values are redacted from recorded response bodies.
+    :type redact_fields: frozenset
+    '''
+
+    def __init__(self, path, mode='replay', realtime=False, redact_fields=REDACT_FIELDS):
+        if mode not in ('record', 'replay'):
+            raise ValueError('Cassette mode expects record|replay but got %s' % mode)
+        self.path = path
+        self.mode = mode
+        self.realtime = realtime
+        self.redact_fields = redact_fields
+        self.interactions = []
+        self._lock = threading.Lock()
+        self._queues = None
+        if mode == 'replay':
+            self.load()
+
+    @property
+    def recording(self):
+        return self.mode == 'record'
+
+    def load(self):
+        with gzip.open(self.path, 'rt') as fd:
+            self.interactions = [json.loads(line) for line in fd if line.strip()]
+        self.rewind()
+
+    def rewind(self):
+        '''
+        Make every recorded interaction available to be replayed again.
+        '''
+        queues = collections.defaultdict(collections.deque)
+        for entry in self.interactions:
+            # Key again, interactions recorded before query params were sorted still match
+            method, _, url = entry['key'].partition(' ')
+            queues[_key(method, url)].append(entry)
+        self._queues = queues
+
+    def save(self):
+        with self._lock:
+            with gzip.open(self.path, 'wt') as fd:
+                for entry in self.interactions:
+                    fd.write(json.dumps(entry, separators=(',', ':')) + '\n')
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, type, value, traceback):
+        if self.recording:
+            self.save()
+
+    def record(self, method, url, resp):
+        '''
+        Capture a response. Reads the whole body, so streamed responses are buffered while recording.
+        '''
+        body = resp.content
+        entry = {'key': _key(method, url), 'status': resp.status_code,
+                 'headers': {k.lower(): v for k, v in resp.headers.items() if k.lower() in KEEP_HEADERS},
+                 'elapsed': round(resp.elapsed.total_seconds(), 6) if resp.elapsed is not None else 0}
+        try:
+            entry['json'] = redact(json.loads(body), self.redact_fields)
+        except ValueError:
+            entry['body'] = base64.b64encode(body).decode()
+        with self._lock:
+            self.interactions.append(entry)
+
+    def play(self, method, url):
+        '''
+        Return the next recorded response for ``method`` and ``url`` as a :class:`requests.Response`.
+        '''
+        key = _key(method, url)
+        with self._lock:
+            queue = self._queues.get(key)
+            if not queue:
+                raise CassetteError('No recorded response left for %s' % key)
+            entry = queue.popleft()
+
+        if self.realtime and entry['elapsed']:
+            time.sleep(entry['elapsed'])
+
+        resp = requests.Response()
+        resp.status_code = entry['status']
+        resp.headers = CaseInsensitiveDict(entry['headers'])
+        resp.url = url
+        resp.encoding = 'utf-8'
+        if 'json' in entry:
+            resp._content = json.dumps(entry['json']).encode()
+        else:
+            resp._content = base64.b64decode(entry['body'])
+        resp._content_consumed = True
+        return resp
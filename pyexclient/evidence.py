@@ -0,0 +1,387 @@
+#!/usr/bin/env python
+'''
+Flattening of vendor alert evidence. ``VendorAlerts.evidence_summary`` is a list of arbitrarily nested documents keyed
+by evidence type, :class:`EvidenceFlattener` turns them into flat ``{'process.parent.name': 'explorer.exe'}`` dicts
+without recursing, and :class:`EvidenceTable` streams the evidence of many vendor alerts into a sparse column store.
+
+Key paths repeat across alerts, so each distinct path string is built once and shared by every alert it appears in.
+
+:class:`EvidenceIndex` maps evidence values (hostnames, IPs, hashes, ...) back to the Expel alerts they were seen in, so
+alerts can be correlated without going back to the API.
+
+Examples:
+    >>> table = EvidenceTable().extend(xc.vendor_alerts.search(created_at=gt(since)))
+    >>> for va_id, host in zip(table.ids, table.column('host.name')):
+    >>>     print(va_id, host)
+'''
+import bisect
+import collections
+import gzip
+import json
+
+
+class EvidenceFlattener:
+    '''
+    Flattens nested dicts and lists into a single level dict keyed by dotted paths, list items are keyed by index.
+
+    :param sep: Separator between the parts of a path.
+    :type sep: str
+    :param max_paths: Number of distinct paths to keep interned, paths beyond it are built every time they are seen.
+    :type max_paths: int
+
+    Examples:
+        >>> EvidenceFlattener().flatten({'a': 'b', 'c': ['a', 'b', {'d': 'e'}]})
+        {'a': 'b', 'c.0': 'a', 'c.1': 'b', 'c.2.d': 'e'}
+    '''
+
+    def __init__(self, sep='.', max_paths=100000):
+        self.sep = sep
+        self.max_paths = max_paths
+        self._paths = {}
+
+    def _join(self, parent, key):
+        try:
+            return self._paths[parent, key]
+        except KeyError:
+            pass
+        path = str(key) if parent is None else parent + self.sep + str(key)
+        if len(self._paths) < self.max_paths:
+            self._paths[parent, key] = path
+        return path
+
+    def flatten(self, blob, out=None):
+        '''
+        Flatten a nested document. Empty dicts and lists have no leaves and are left out.
+
+        :param blob: The document
+        :type blob: dict or list
+        :param out: Dict to add the leaves to, later values of a path replace earlier ones.
+        :type out: dict or None
+        :return: Path to leaf value
+        :rtype: dict
+        '''
+        out = {} if out is None else out
+        join = self._join
+        stack = [(None, blob)]
+        while stack:
+            path, node = stack.pop()
+            if type(node) is dict:
+                items = node.items()
+            elif type(node) is list:
+                items = enumerate(node)
+            else:
+                out['' if path is None else path] = node
+                continue
+            # Push children in reverse so they come off the stack, and into out, in document order
+            stack.extend(reversed([(join(path, key), value) for key, value in items]))
+        return out
+
+    def flatten_evidence(self, summary):
+        '''
+        Flatten a vendor alert's ``evidence_summary``. Its entries are merged, so a path seen in several entries keeps
+        the value of the last one.
+
+        :param summary: The evidence summary, a list of documents keyed by evidence type, or a single one.
+        :type summary: list or dict or None
+        :return: Path to leaf value, paths start with the evidence type, e.g. ``host.ip``
+        :rtype: dict
+
+        Examples:
+            >>> EvidenceFlattener().flatten_evidence(va.evidence_summary)
+            {'process.name': 'cmd.exe', 'process.parent.name': 'explorer.exe', 'host.name': 'host-1.example.com'}
+        '''
+        out = {}
+        if not summary:
+            return out
+        if type(summary) is not list:
+            summary = [summary]
+        for entry in summary:
+            if entry:
+                self.flatten(entry, out)
+        return out
+
+
+class EvidenceTable:
+    '''
+    Sparse column store of flattened evidence, one row per vendor alert and one column per path. Each column only holds
+    the rows that have a value for it.
+
+    :param flattener: The flattener, pass one in to share its interned paths between tables.
+    :type flattener: EvidenceFlattener or None
+    '''
+
+    def __init__(self, flattener=None):
+        self.flattener = flattener or EvidenceFlattener()
+        self.ids = []
+        self._columns = {}
+
+    def __len__(self):
+        return len(self.ids)
+
+    @property
+    def columns(self):
+        '''
+        :return: The column names, in the order they were first seen.
+        :rtype: list
+        '''
+        return list(self._columns)
+
+    def add(self, row_id, summary):
+        '''
+        Add the evidence of one vendor alert as a new row.
+
+        :param row_id: The row's identifier, e.g. the vendor alert id.
+        :type row_id: str
+        :param summary: The evidence summary.
+        :type summary: list or dict or None
+        :return: The row number.
+        :rtype: int
+        '''
+        row = len(self.ids)
+        self.ids.append(row_id)
+        columns = self._columns
+        for path, value in self.flattener.flatten_evidence(summary).items():
+            column = columns.get(path)
+            if column is None:
+                column = columns[path] = ([], [])
+            column[0].append(row)
+            column[1].append(value)
+        return row
+
+    def extend(self, vendor_alerts, field='evidence_summary'):
+        '''
+        Add a row for each vendor alert. Alerts are consumed one at a time, so a search can be streamed in without
+        holding its records.
+
+        :param vendor_alerts: Vendor alerts, e.g. ``xc.vendor_alerts.search(...)``.
+        :type vendor_alerts: iterable
+        :param field: The attribute holding the evidence.
+        :type field: str
+        :return: The table
+        :rtype: EvidenceTable
+        '''
+        for va in vendor_alerts:
+            self.add(va.id, getattr(va, field))
+        return self
+
+    def column(self, name, default=None):
+        '''
+        :param name: The column name, e.g. ``host.ip``
+        :type name: str
+        :param default: Value of rows without the column.
+        :return: The value of every row, in row order.
+        :rtype: list
+        '''
+        values = [default] * len(self.ids)
+        rows, column = self._columns.get(name, ((), ()))
+        for row, value in zip(rows, column):
+            values[row] = value
+        return values
+
+    def count(self, name):
+        '''
+        :return: The number of rows with a value for the column.
+        :rtype: int
+        '''
+        return len(self._columns.get(name, ((), ()))[0])
+
+    def row(self, row):
+        '''
+        :param row: The row number.
+        :type row: int
+        :return: Path to value of the columns the row has.
+        :rtype: dict
+        '''
+        out = {}
+        for name, (rows, values) in self._columns.items():
+            # Rows are appended in order, so a column's row numbers are sorted
+            at = bisect.bisect_left(rows, row)
+            if at < len(rows) and rows[at] == row:
+                out[name] = values[at]
+        return out
+
+
+class EvidenceIndex:
+    '''
+    Inverted index of ``vendor_alert_evidences``: evidence type to evidence value to the ids of the Expel alerts it was
+    seen in, plus the evidence of each alert. It is built incrementally, one search page at a time.
+
+    :param casefold: Match string values case insensitively, as hostnames and hashes usually should be.
+    :type casefold: bool
+
+    Examples:
+        >>> index = EvidenceIndex()
+        >>> index.update_from(xc, created_at=gt(since))
+        >>> index.lookup('HOSTNAME', 'host-1.example.com')
+        frozenset({'3b2d...', '9a1f...'})
+        >>> index.intersect(('HOSTNAME', 'host-1.example.com'), ('SOURCE_IP', '10.0.0.7'))
+        >>> index.correlated(ea.id).most_common(5)
+    '''
+    RELATIONSHIP = 'evidenced_expel_alerts'
+
+    def __init__(self, casefold=True):
+        self.casefold = casefold
+        self._index = {}
+        self._alerts = {}
+
+    def __len__(self):
+        return len(self._alerts)
+
+    @property
+    def types(self):
+        '''
+        :return: The evidence types indexed.
+        :rtype: list
+        '''
+        return list(self._index)
+
+    def _key(self, value):
+        if self.casefold and isinstance(value, str):
+            return value.casefold()
+        return value
+
+    def add(self, alert_id, evidence_type, value):
+        '''
+        Index one piece of evidence of an alert.
+
+        :param alert_id: The Expel alert id.
+        :type alert_id: str
+        :param evidence_type: The evidence type, e.g. ``HOSTNAME``
+        :type evidence_type: str
+        :param value: The evidence value.
+        :type value: str
+        '''
+        value = self._key(value)
+        self._index.setdefault(evidence_type, {}).setdefault(value, set()).add(alert_id)
+        self._alerts.setdefault(alert_id, set()).add((evidence_type, value))
+
+    def add_evidence(self, evidences):
+        '''
+        Index ``vendor_alert_evidences`` records. The alerts each one belongs to are read from the resource linkage of
+        its ``evidenced_expel_alerts`` relationship, search with ``include('evidenced_expel_alerts')`` to get it, or
+        use :meth:`update_from`. Records are consumed one at a time, so a search can be streamed in.
+
+        :param evidences: The evidence records.
+        :type evidences: iterable
+        :return: The number of records indexed.
+        :rtype: int
+        '''
+        count = 0
+        for ev in evidences:
+            evidence_type, value = ev.evidence_type, ev.evidence
+            if evidence_type is None or value is None:
+                continue
+            for alert_id in ev.rel_ids(self.RELATIONSHIP):
+                self.add(alert_id, evidence_type, value)
+            count += 1
+        return count
+
+    def update_from(self, xc, *args, **kwargs):
+        '''
+        Index the evidence matching a search, e.g. everything created since the last update.
+
+        :param xc: The client.
+        :type xc: WorkbenchClient
+        :param args: Operators of relationship|sort applied to the search of ``vendor_alert_evidences``.
+        :type args: tuple
+        :param kwargs: Fields and values to search on.
+        :type kwargs: dict
+        :return: The number of records indexed.
+        :rtype: int
+        '''
+        from .workbench import fields
+        from .workbench import include
+        # Only the linkage of the alerts is needed, keep their included documents small
+        return self.add_evidence(xc.vendor_alert_evidences.search(
+            include(self.RELATIONSHIP), fields('status', api_type='expel_alerts'), *args, **kwargs))
+
+    def lookup(self, evidence_type, value):
+        '''
+        :return: The ids of the alerts a piece of evidence was seen in.
+        :rtype: frozenset
+        '''
+        return frozenset(self._index.get(evidence_type, {}).get(self._key(value), ()))
+
+    def find(self, value):
+        '''
+        Look a value up across every evidence type, for when the type isn't known.
+
+        :return: Evidence type to the ids of the alerts the value was seen in as that type.
+        :rtype: dict
+        '''
+        value = self._key(value)
+        return {evidence_type: frozenset(values[value]) for evidence_type, values in self._index.items()
+                if value in values}
+
+    def intersect(self, *evidence):
+        '''
+        :param evidence: ``(evidence_type, value)`` pairs.
+        :type evidence: tuple
+        :return: The ids of the alerts that have all of the evidence.
+        :rtype: frozenset
+        '''
+        # Start from the rarest evidence so the intersection only ever shrinks from the smallest set
+        sets = sorted((self.lookup(evidence_type, value) for evidence_type, value in evidence), key=len)
+        if not sets:
+            return frozenset()
+        return frozenset(sets[0]).intersection(*sets[1:])
+
+    def union(self, *evidence):
+        '''
+        :param evidence: ``(evidence_type, value)`` pairs.
+        :type evidence: tuple
+        :return: The ids of the alerts that have any of the evidence.
+        :rtype: frozenset
+        '''
+        return frozenset().union(*(self.lookup(evidence_type, value) for evidence_type, value in evidence))
+
+    def evidence_of(self, alert_id):
+        '''
+        :return: The ``(evidence_type, value)`` pairs of an alert.
+        :rtype: frozenset
+        '''
+        return frozenset(self._alerts.get(alert_id, ()))
+
+    def correlated(self, alert_id, evidence_types=None):
+        '''
+        Find the alerts sharing evidence with an alert.
+
+        :param alert_id: The Expel alert id.
+        :type alert_id: str
+        :param evidence_types: Only consider these evidence types, all if None.
+        :type evidence_types: list or None
+        :return: Other alert id to the number of pieces of evidence it shares.
+        :rtype: collections.Counter
+        '''
+        shared = collections.Counter()
+        for evidence_type, value in self._alerts.get(alert_id, ()):
+            if evidence_types is None or evidence_type in evidence_types:
+                shared.update(self._index[evidence_type][value])
+        shared.pop(alert_id, None)
+        return shared
+
+    def save(self, path):
+        '''
+        Write the index to a gzipped JSON lines file, one line per evidence value.
+        '''
+        with gzip.open(path, 'wt') as fd:
+            fd.write(json.dumps({'casefold': self.casefold}) + '\n')
+            for evidence_type, values in self._index.items():
+                for value, alert_ids in values.items():
+                    fd.write(json.dumps([evidence_type, value, sorted(alert_ids)], separators=(',', ':')) + '\n')
+
+    @classmethod
+    def load(cls, path):
+        '''
+        Read an index written by :meth:`save`, it can be updated further.
+        '''
+        with gzip.open(path, 'rt') as fd:
+            index = cls(**json.loads(fd.readline()))
+            for line in fd:
+                if not line.strip():
+                    continue
+                evidence_type, value, alert_ids = json.loads(line)
+                index._index.setdefault(evidence_type, {})[value] = set(alert_ids)
+                for alert_id in alert_ids:
+                    index._alerts.setdefault(alert_id, set()).add((evidence_type, value))
+        return index
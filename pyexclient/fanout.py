@@ -0,0 +1,272 @@
+#!/usr/bin/env python
+'''
+Run the same search against many tenants at once. A :class:`FanOut` takes a query template and a list of tenants, runs
+the template for every tenant over a bounded pool of threads and streams the merged results back tagged with the
+tenant they came from. Each tenant can be rate limited on its own, and a tenant that fails or runs past its deadline is
+recorded in :attr:`FanOut.errors` without holding up the others.
+
+Examples:
+    >>> xc = WorkbenchClient('https://workbench.expel.io', token=token)
+    >>> incidents = xc.investigations.prepare(relationship('organization.id', param('org')), is_incident=True)
+    >>> fan = FanOut(incidents, workers=16, rate_limit=5)
+    >>> for org_id, inv in fan.run(org_ids, client=xc):
+    >>>     print(org_id, inv.title)
+    >>> print(fan.errors)
+'''
+import concurrent.futures
+import logging
+import queue
+import threading
+import time
+
+import requests
+
+from .auth import bearer
+from .transport import WireStats
+
+
+logger = logging.getLogger(__name__)
+
+_DONE = object()
+
+
+class TenantDeadlineExceeded(Exception):
+    '''
+    Raised for a tenant whose search ran past the :class:`FanOut` deadline.
+    '''
+
+
+class RateLimiter:
+    '''
+    Space calls out to at most ``rate`` per second.
+
+    :param rate: Maximum calls per second.
+    :type rate: float
+    '''
+
+    def __init__(self, rate):
+        self.interval = 1.0 / rate
+        self._next = 0
+        self._lock = threading.Lock()
+
+    def wait(self):
+        with self._lock:
+            now = time.monotonic()
+            delay = self._next - now
+            self._next = max(now, self._next) + self.interval
+        if delay > 0:
+            time.sleep(delay)
+
+
+class _TenantConn:
+    '''
+    Issue a tenant's requests through a shared client, subject to the tenant's rate limit and deadline.
+    '''
+
+    def __init__(self, conn, tenant, limiter=None, deadline=None, deadline_at=None):
+        self._conn = conn
+        self._tenant = tenant
+        self._limiter = limiter
+        self._deadline = deadline
+        self._deadline_at = deadline_at
+
+    def _exceeded(self):
+        return TenantDeadlineExceeded('Tenant %s exceeded deadline of %ss' % (self._tenant, self._deadline))
+
+    def request(self, *args, **kwargs):
+        if self._limiter is not None:
+            self._limiter.wait()
+        if self._deadline_at is None:
+            return self._conn.request(*args, **kwargs)
+
+        # Time the request out when the deadline passes, rather than only noticing between results
+        remaining = self._deadline_at - time.monotonic()
+        if remaining <= 0:
+            raise self._exceeded()
+        timeout = kwargs.get('timeout', getattr(self._conn, 'default_request_kwargs', {}).get('timeout'))
+        kwargs['timeout'] = min(timeout, remaining) if isinstance(timeout, (int, float)) else remaining
+        try:
+            return self._conn.request(*args, **kwargs)
+        except requests.exceptions.RequestException as e:
+            # A timeout surfaces as a ConnectionError once the retries are used up
+            if time.monotonic() >= self._deadline_at:
+                raise self._exceeded() from e
+            raise
+
+    def __getattr__(self, name):
+        return getattr(self._conn, name)
+
+
+def _release(record):
+    # Hand a record, and the related records it was fetched with, back the tenant's client, so a lazy load after the
+    # search is neither rate limited nor cut off by the tenant's deadline
+    conn = getattr(record, '_conn', None)
+    if not isinstance(conn, _TenantConn):
+        return record
+    record._conn = conn._conn
+    for related in record._relobjs.values():
+        for inst in related if isinstance(related, list) else [related]:
+            _release(inst)
+    return record
+
+
+def _token_client(client, token):
+    # A client for another tenant's token with the caller's settings, e.g. transport, retries and typed
+    state = client.__getstate__()
+    state.update(token=bearer(token), token_provider=None, username=None, wire_stats=WireStats())
+    conn = type(client).__new__(type(client))
+    conn.__setstate__(state)
+    return conn
+
+
+class FanOut:
+    '''
+    Run a query template against many tenants concurrently.
+
+    The template is either a :class:`~pyexclient.workbench.PreparedSearch` or a callable ``template(client, tenant)``
+    returning an iterable of results. A prepared search with one :class:`~pyexclient.workbench.param` has the tenant
+    bound to it, a prepared search without params is run as is (useful when every tenant has its own token).
+
+    :param template: The search to run for every tenant.
+    :type template: PreparedSearch or callable
+    :param workers: Maximum number of tenants searched at once.
+    :type workers: int
+    :param rate_limit: Maximum requests per second issued for any one tenant, unlimited if None.
+    :type rate_limit: float or None
+    :param deadline: Seconds a tenant may take before its search is abandoned, unlimited if None. Requests the tenant
+        has in flight are timed out at the deadline.
+    :type deadline: float or None
+    :param buffer: Maximum number of results waiting to be consumed before the tenant threads pause.
+    :type buffer: int
+    '''
+
+    def __init__(self, template, workers=8, rate_limit=None, deadline=None, buffer=1000):
+        params = getattr(template, 'params', None)
+        if params is not None and len(params) > 1:
+            raise ValueError('Fan out template expects at most one param, got %s' % ','.join(sorted(params)))
+        self.template = template
+        self.workers = workers
+        self.rate_limit = rate_limit
+        self.deadline = deadline
+        self.buffer = buffer
+        self.errors = {}
+        self.counts = {}
+        self._lock = threading.Lock()
+
+    def _clients(self, tenants, client):
+        if isinstance(tenants, dict):
+            for tenant, conn in tenants.items():
+                if isinstance(conn, str):
+                    if client is None:
+                        raise ValueError('Fan out over tokens requires a client to take the base url from')
+                    conn = _token_client(client, conn)
+                yield tenant, conn
+        else:
+            if client is None:
+                raise ValueError('Fan out over organization ids requires a client')
+            for tenant in tenants:
+                yield tenant, client
+
+    def _search(self, tenant, conn, deadline_at):
+        if self.rate_limit or deadline_at is not None:
+            conn = _TenantConn(conn, tenant, RateLimiter(self.rate_limit) if self.rate_limit else None, self.deadline,
+                               deadline_at)
+        if callable(self.template):
+            return self.template(conn, tenant)
+        if self.template.params:
+            return self.template.using(conn).search(**{next(iter(self.template.params)): tenant})
+        return self.template.using(conn).search()
+
+    def run(self, tenants, client=None):
+        '''
+        Run the template for every tenant, yielding results as they arrive.
+
+        :param tenants: Organization ids searched through ``client``, or a dict of tenant to token or client.
+        :type tenants: list or dict
+        :param client: The client to issue requests with, and the base url of clients built from tokens.
+        :type client: WorkbenchClient
+        :return: ``(tenant, result)`` tuples, in no particular order across tenants.
+        :rtype: generator
+        '''
+        self.errors = {}
+        self.counts = {}
+        results = queue.Queue(maxsize=self.buffer)
+        stop = threading.Event()
+        started = {}
+        abandoned = set()
+
+        def put(tenant, item):
+            while not stop.is_set() and tenant not in abandoned:
+                try:
+                    results.put((tenant, item), timeout=0.1)
+                    return True
+                except queue.Full:
+                    continue
+            return False
+
+        def work(tenant, conn):
+            now = time.monotonic()
+            with self._lock:
+                started[tenant] = now
+            deadline_at = now + self.deadline if self.deadline is not None else None
+            count = 0
+            error = None
+            try:
+                for result in self._search(tenant, conn, deadline_at):
+                    if deadline_at is not None and time.monotonic() > deadline_at:
+                        raise TenantDeadlineExceeded('Tenant %s exceeded deadline of %ss' % (tenant, self.deadline))
+                    if not put(tenant, _release(result)):
+                        return
+                    count += 1
+            except Exception as e:
+                logger.warning('Fan out search for tenant %s failed: %s', tenant, e)
+                error = e
+            finally:
+                with self._lock:
+                    # An abandoned tenant was already accounted for when it was given up on
+                    if tenant not in abandoned:
+                        self.counts[tenant] = count
+                        if error is not None:
+                            self.errors[tenant] = error
+                put(tenant, _DONE)
+
+        def abandon_overdue(pending, delivered):
+            now = time.monotonic()
+            with self._lock:
+                for tenant in list(pending):
+                    if tenant in started and now - started[tenant] > self.deadline:
+                        logger.warning('Fan out search for tenant %s abandoned after %ss', tenant, self.deadline)
+                        abandoned.add(tenant)
+                        pending.discard(tenant)
+                        self.counts[tenant] = delivered.get(tenant, 0)
+                        self.errors[tenant] = TenantDeadlineExceeded(
+                            'Tenant %s exceeded deadline of %ss' % (tenant, self.deadline))
+
+        pool = concurrent.futures.ThreadPoolExecutor(max_workers=self.workers)
+        try:
+            pending = set()
+            delivered = {}
+            for tenant, conn in self._clients(tenants, client):
+                pool.submit(work, tenant, conn)
+                pending.add(tenant)
+
+            while pending:
+                try:
+                    tenant, item = results.get(timeout=0.05 if self.deadline is not None else None)
+                except queue.Empty:
+                    # A tenant stuck past its deadline, e.g. inside a request, is given up on rather than waited for
+                    abandon_overdue(pending, delivered)
+                    continue
+                if self.deadline is not None:
+                    abandon_overdue(pending, delivered)
+                if tenant not in pending:
+                    continue
+                if item is _DONE:
+                    pending.discard(tenant)
+                    continue
+                delivered[tenant] = delivered.get(tenant, 0) + 1
+                yield tenant, item
+        finally:
+            stop.set()
+            # Threads still inside a request finish in the background
+            pool.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,135 @@
+#!/usr/bin/env python
+'''
+Compiled, read only view of the Workbench JSON API schema. The schema is shipped as ``schema.json`` next to this module
+and compiled once into per resource type sets and field to type maps. Query building, validation and relationship
+resolution all share the same :class:`SchemaRegistry`.
+'''
+import json
+import os
+from collections import namedtuple
+from types import MappingProxyType
+
+
+SCHEMA_PATH = os.path.join(os.path.dirname(__file__), 'schema.json')
+
+
+class ResourceSchema(namedtuple('ResourceSchema', ['api_type', 'attributes', 'relationships', 'attribute_types', 'relationship_types'])):
+    '''
+    Schema of a single resource type.
+
+    :param api_type: The JSON API resource type name, e.g. ``investigations``
+    :type api_type: str
+    :param attributes: Names of the attributes of the resource type.
+    :type attributes: frozenset
+    :param relationships: Names of the relationships of the resource type.
+    :type relationships: frozenset
+    :param attribute_types: Attribute name to JSON type, e.g. ``string`` or ``boolean``.
+    :type attribute_types: Mapping
+    :param relationship_types: Relationship name to the resource type it points at.
+    :type relationship_types: Mapping
+    '''
+    __slots__ = ()
+
+    @classmethod
+    def from_dict(cls, api_type, raw):
+        return cls(api_type,
+                   frozenset(raw.get('attributes', ())),
+                   frozenset(raw.get('relationships', ())),
+                   MappingProxyType(dict(raw.get('attributes', {}))),
+                   MappingProxyType(dict(raw.get('relationships', {}))))
+
+    @classmethod
+    def from_lists(cls, api_type, attributes, relationships):
+        '''
+        Build a schema for a resource type the registry does not know about, from plain lists of field names.
+        '''
+        return cls.from_dict(api_type, {'attributes': {name: None for name in attributes},
+                                        'relationships': {name: None for name in relationships}})
+
+    def is_field(self, name):
+        return name in self.attributes or name in self.relationships
+
+    def timestamp_fields(self):
+        '''
+        Names of the attributes holding an ISO 8601 timestamp, e.g. ``created_at``. The schema types them as plain
+        strings, so they are told apart by name.
+        '''
+        return frozenset(name for name, json_type in self.attribute_types.items()
+                         if json_type == 'string' and (name.endswith('_at') or name.endswith('_time')))
+
+
+class SchemaRegistry:
+    '''
+    All resource type schemas, keyed by resource type name.
+
+    :param types: Resource type name to :class:`ResourceSchema`
+    :type types: dict
+    :param field_to_type: Relationship name to the resource type it points at, across all resource types.
+    :type field_to_type: dict
+    '''
+
+    def __init__(self, types, field_to_type):
+        self._types = MappingProxyType(dict(types))
+        self.field_to_type = MappingProxyType(dict(field_to_type))
+
+    @classmethod
+    def loads(cls, blob):
+        raw = json.loads(blob)
+        if raw.get('version') != 1:
+            raise ValueError('Unsupported schema version %s' % raw.get('version'))
+        types = {api_type: ResourceSchema.from_dict(api_type, entry) for api_type, entry in raw['types'].items()}
+        return cls(types, raw.get('field_to_type', {}))
+
+    @classmethod
+    def load(cls, path=SCHEMA_PATH):
+        with open(path, 'r') as fd:
+            return cls.loads(fd.read())
+
+    def dumps(self):
+        '''
+        Serialize the registry back to the compact form read by :meth:`loads`.
+        '''
+        return json.dumps({
+            'version': 1,
+            'field_to_type': dict(self.field_to_type),
+            'types': {api_type: {'attributes': dict(schema.attribute_types), 'relationships': dict(schema.relationship_types)}
+                      for api_type, schema in self._types.items()},
+        }, separators=(',', ':'), sort_keys=True)
+
+    def get(self, api_type, default=None):
+        return self._types.get(api_type, default)
+
+    def __getitem__(self, api_type):
+        return self._types[api_type]
+
+    def __contains__(self, api_type):
+        return api_type in self._types
+
+    def __iter__(self):
+        return iter(self._types)
+
+    def __len__(self):
+        return len(self._types)
+
+
+_registry = None
+
+
+def registry():
+    '''
+    Return the :class:`SchemaRegistry` compiled from the bundled ``schema.json``, loading it on first use.
+
+    :return: The shared schema registry
+    :rtype: SchemaRegistry
+
+    Examples:
+        >>> schema = registry()['investigations']
+        >>> 'close_comment' in schema.attributes
+        True
+        >>> schema.relationship_types['organization']
+        'organizations'
+    '''
+    global _registry
+    if _registry is None:
+        _registry = SchemaRegistry.load()
+    return _registry
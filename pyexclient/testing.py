@@ -0,0 +1,563 @@
+#!/usr/bin/env python
+'''
+A local stand-in for the Workbench JSON API, for tests and benchmarks that want real HTTP, pagination and JSON
+decoding without talking to Workbench.
+
+The server generates a synthetic, deterministic data set (organizations, investigations, expel_alerts, vendor_alerts,
+their evidences, investigative actions and histories) at a configurable scale, and serves it with ``links.next``
+pagination, ``include``, ``filter[...]`` and ``sort``. Latency and HTTP 429 rate limiting can be injected.
+
+Examples:
+    >>> with MockWorkbench(investigations=100, latency=0.005) as wb:
+    >>>     xc = wb.client()
+    >>>     for ea in xc.expel_alerts.search(expel_severity='HIGH'):
+    >>>         print(ea.investigation.title)
+'''
+import datetime
+import gzip
+import json
+import random
+import socket
+import threading
+import time
+import uuid
+from http.server import BaseHTTPRequestHandler
+from http.server import ThreadingHTTPServer
+from urllib.parse import parse_qsl
+from urllib.parse import urlencode
+from urllib.parse import urlsplit
+
+from .schema import registry
+
+
+EPOCH = datetime.datetime(2020, 1, 1)
+SEVERITIES = ['CRITICAL', 'HIGH', 'MEDIUM', 'LOW', 'TESTING']
+EVIDENCE_TYPES = ['HOSTNAME', 'SOURCE_IP', 'FILE_HASH', 'USERNAME']
+
+
+def _timestamp(minutes):
+    return (EPOCH + datetime.timedelta(minutes=minutes)).strftime('%Y-%m-%dT%H:%M:%S.%f')[:-3] + 'Z'
+
+
+def _as_time(value):
+    # Workbench compares timestamp fields as times, whatever the ISO 8601 form of the filter value
+    if not isinstance(value, str) or value[4:5] != '-' or not value[:4].isdigit():
+        return None
+    try:
+        parsed = datetime.datetime.fromisoformat(value[:-1] + '+00:00' if value.endswith('Z') else value)
+    except ValueError:
+        return None
+    return parsed if parsed.tzinfo is not None else parsed.replace(tzinfo=datetime.timezone.utc)
+
+
+def _match(value, cond):
+    '''
+    Evaluate a single Workbench filter value (as produced by the client operators) against a field value.
+    '''
+    if cond == '\u2400true':
+        return value is None
+    if cond == '\u2400false':
+        return value is not None
+    if value is None:
+        return False
+    if isinstance(value, bool):
+        value = 'true' if value else 'false'
+        cond = cond.lower()
+
+    op, operand = cond[:1], cond[1:]
+    if op in ('>', '<'):
+        if isinstance(value, (int, float)):
+            try:
+                operand = float(operand)
+            except ValueError:
+                return False
+        elif _as_time(value) is not None and _as_time(operand) is not None:
+            value, operand = _as_time(value), _as_time(operand)
+        else:
+            value = str(value)
+        return value > operand if op == '>' else value < operand
+    if op == '!':
+        return not _same(value, operand)
+    if op == ':':
+        return operand.lower() in str(value).lower()
+    if op == '^':
+        return str(value).startswith(operand)
+    return _same(value, cond)
+
+
+def _same(value, operand):
+    if _as_time(value) is not None and _as_time(operand) is not None:
+        return _as_time(value) == _as_time(operand)
+    return str(value) == operand
+
+
+def _fieldsets(params):
+    # fields[type]=a,b sparse fieldsets, type to the set of field names
+    return {key[len('fields['):-1]: set(value.split(',')) for key, value in params if key.startswith('fields[')}
+
+
+def _sort_key(value):
+    # None sorts last in ascending order and first in descending order, PostgreSQL's default NULLS LAST / NULLS FIRST
+    return (value is None, value if value is not None else '')
+
+
+class _Store:
+    '''
+    In memory records keyed by type and id. Relationships are kept as ``(type, id)`` for to-one and lists of those for
+    to-many relationships.
+    '''
+
+    def __init__(self):
+        self.records = {}
+        self.lock = threading.Lock()
+
+    def add(self, api_type, id, attributes, relationships=None):
+        schema = registry()[api_type]
+        attrs = {name: None for name in schema.attributes}
+        attrs.update(attributes)
+        rec = {'type': api_type, 'id': id, 'attributes': attrs, 'relationships': dict(relationships or {})}
+        self.records.setdefault(api_type, {})[id] = rec
+        return rec
+
+    def link(self, rec, name, other):
+        '''
+        Append ``other`` to the to-many relationship ``name`` of ``rec``.
+        '''
+        rec['relationships'].setdefault(name, []).append((other['type'], other['id']))
+
+    def get(self, api_type, id):
+        return self.records.get(api_type, {}).get(id)
+
+    def related(self, rec, name):
+        data = rec['relationships'].get(name)
+        if data is None:
+            return [] if name.endswith('s') else None
+        if isinstance(data, tuple):
+            return self.get(*data)
+        return [r for r in (self.get(*ref) for ref in data) if r is not None]
+
+
+class MockWorkbench:
+    '''
+    Local JSON API server standing in for Workbench.
+
+    :param organizations: Number of organizations.
+    :type organizations: int
+    :param investigations: Investigations per organization.
+    :type investigations: int
+    :param expel_alerts: Expel alerts per investigation.
+    :type expel_alerts: int
+    :param vendor_alerts: Vendor alerts per expel alert.
+    :type vendor_alerts: int
+    :param evidences: Vendor alert evidences per vendor alert.
+    :type evidences: int
+    :param investigative_actions: Investigative actions per investigation.
+    :type investigative_actions: int
+    :param histories: History records per investigation and per expel alert.
+    :type histories: int
+    :param page_size: Default page size when the request has no ``page[limit]``.
+    :type page_size: int
+    :param latency: Seconds to wait before answering each request.
+    :type latency: float
+    :param throttle_every: Answer every Nth request with HTTP 429, 0 disables throttling.
+    :type throttle_every: int
+    :param download_size: Size in bytes of investigative action and file downloads.
+    :type download_size: int
+    :param seed: Seed for the generated data.
+    :type seed: int
+    :param tokens: Bearer tokens the API accepts, answering anything else with HTTP 401. Any token is accepted if None.
+        The set can be changed while the server runs, e.g. to revoke a token.
+    :type tokens: set or None
+    '''
+
+    def __init__(self, organizations=2, investigations=10, expel_alerts=3, vendor_alerts=2, evidences=2,
+                 investigative_actions=2, histories=2, page_size=50, latency=0, throttle_every=0,
+                 download_size=64 * 1024, seed=0, tokens=None):
+        self.tokens = tokens
+        self.page_size = page_size
+        self.latency = latency
+        self.throttle_every = throttle_every
+        self.download_size = download_size
+        self.store = _Store()
+        self.stats = {'requests': 0, 'connections': 0, 'throttled': 0, 'in_flight': 0, 'peak_in_flight': 0}
+        self._stats_lock = threading.Lock()
+        self._rng = random.Random(seed)
+        self._clock = 0
+        self._server = None
+        self._thread = None
+        self._generate(organizations, investigations, expel_alerts, vendor_alerts, evidences, investigative_actions,
+                       histories)
+
+    def _uuid(self):
+        return str(uuid.UUID(int=self._rng.getrandbits(128), version=4))
+
+    def _tick(self):
+        self._clock += 1
+        return _timestamp(self._clock)
+
+    def _generate(self, n_orgs, n_invs, n_alerts, n_vas, n_evs, n_actions, n_hist):
+        store, rng = self.store, self._rng
+        for o in range(n_orgs):
+            ts = self._tick()
+            org = store.add('organizations', self._uuid(), {
+                'name': 'Organization %d' % o, 'short_name': 'ORG%d' % o, 'created_at': ts, 'updated_at': ts})
+            org_ref = ('organizations', org['id'])
+
+            for i in range(n_invs):
+                ts = self._tick()
+                inv = store.add('investigations', self._uuid(), {
+                    'title': 'Investigation %d-%d' % (o, i), 'short_link': 'ORG%d-%d' % (o, i),
+                    'is_incident': i % 5 == 0, 'created_at': ts, 'updated_at': ts, 'status_updated_at': ts,
+                    'close_comment': None if i % 2 else 'closed %d' % i}, {'organization': org_ref})
+                store.link(org, 'investigations', inv)
+
+                for a in range(n_alerts):
+                    ts = self._tick()
+                    attrs = {name: rng.randint(0, 100) for name in sorted(registry()['expel_alerts'].attributes)
+                             if name.endswith('_count')}
+                    attrs.update({
+                        'expel_name': 'Alert %d-%d-%d' % (o, i, a), 'expel_severity': rng.choice(SEVERITIES),
+                        'status': 'CLOSED' if a % 2 else 'OPEN', 'created_at': ts, 'updated_at': ts,
+                        'expel_message': 'Suspicious activity ' * 5})
+                    ea = store.add('expel_alerts', self._uuid(), attrs, {
+                        'organization': org_ref, 'investigation': ('investigations', inv['id'])})
+                    store.link(inv, 'expel_alerts', ea)
+                    if a == 0:
+                        inv['relationships']['lead_expel_alert'] = ('expel_alerts', ea['id'])
+
+                    for v in range(n_vas):
+                        ts = self._tick()
+                        host = 'host-%d.example.com' % rng.randint(0, 50)
+                        ip = '10.0.%d.%d' % (rng.randint(0, 3), rng.randint(0, 255))
+                        evidence_summary = [{'process': {'name': 'cmd.exe', 'parent': {'name': 'explorer.exe'},
+                                                         'args': ['/c', 'whoami']},
+                                             'host': {'name': host, 'ip': ip}}]
+                        va = store.add('vendor_alerts', self._uuid(), {
+                            'vendor_sig_name': 'Signature %d' % rng.randint(0, 20), 'description': 'Vendor alert',
+                            'vendor_message': 'Something happened on %s' % host, 'vendor_severity': 'HIGH',
+                            'created_at': ts, 'updated_at': ts, 'evidence_summary': evidence_summary},
+                            {'organization': org_ref})
+                        store.link(va, 'expel_alerts', ea)
+                        store.link(ea, 'vendor_alerts', va)
+
+                        for e in range(n_evs):
+                            ev_type = EVIDENCE_TYPES[e % len(EVIDENCE_TYPES)]
+                            value = {'HOSTNAME': host, 'SOURCE_IP': ip}.get(ev_type, '%s-%d' % (ev_type.lower(), rng.randint(0, 50)))
+                            ev = store.add('vendor_alert_evidences', self._uuid(), {
+                                'evidence_type': ev_type, 'evidence': value}, {'vendor_alert': ('vendor_alerts', va['id'])})
+                            store.link(ev, 'evidenced_expel_alerts', ea)
+                            store.link(va, 'evidences', ev)
+                            store.link(ea, 'evidence', ev)
+
+                    for h in range(n_hist):
+                        ts = self._tick()
+                        hist = store.add('expel_alert_histories', self._uuid(), {
+                            'action': 'STATUS_CHANGED', 'value': {'status': 'CLOSED'}, 'created_at': ts}, {
+                            'expel_alert': ('expel_alerts', ea['id']), 'investigation': ('investigations', inv['id']),
+                            'organization': org_ref})
+                        store.link(ea, 'expel_alert_histories', hist)
+
+                for n in range(n_actions):
+                    ts = self._tick()
+                    ia = store.add('investigative_actions', self._uuid(), {
+                        'title': 'Action %d' % n, 'action_type': 'TASKABILITY', 'status': 'COMPLETED',
+                        'result_task_id': self._uuid(), 'created_at': ts, 'updated_at': ts},
+                        {'investigation': ('investigations', inv['id']), 'organization': org_ref})
+                    store.link(inv, 'investigative_actions', ia)
+
+                for h in range(n_hist):
+                    ts = self._tick()
+                    hist = store.add('investigation_histories', self._uuid(), {
+                        'action': 'CHANGED', 'value': {'title': inv['attributes']['title']}, 'created_at': ts,
+                        'is_incident': inv['attributes']['is_incident']},
+                        {'investigation': ('investigations', inv['id']), 'organization': org_ref})
+                    store.link(inv, 'investigation_histories', hist)
+
+    @property
+    def base_url(self):
+        host, port = self._server.server_address[:2]
+        return 'http://%s:%d' % (host, port)
+
+    def start(self):
+        '''
+        Start serving on a free localhost port in a background thread.
+        '''
+        self._server = ThreadingHTTPServer(('127.0.0.1', 0), _Handler)
+        self._server.daemon_threads = True
+        self._server.workbench = self
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, type, value, traceback):
+        self.stop()
+
+    def client(self, **kwargs):
+        '''
+        Return a :class:`~pyexclient.workbench.WorkbenchClient` pointed at this server.
+        '''
+        from .workbench import WorkbenchClient
+        kwargs.setdefault('token', 'mock-token')
+        return WorkbenchClient(self.base_url, **kwargs)
+
+    def records(self, api_type):
+        return list(self.store.records.get(api_type, {}).values())
+
+    def _bump(self, key, n=1):
+        with self._stats_lock:
+            self.stats[key] = self.stats.get(key, 0) + n
+            return self.stats[key]
+
+    def _enter(self):
+        # Track requests being answered at once, the peak shows how far a client overlaps its requests
+        with self._stats_lock:
+            self.stats['in_flight'] += 1
+            self.stats['peak_in_flight'] = max(self.stats['peak_in_flight'], self.stats['in_flight'])
+
+    def render(self, rec, fields=None, linkage=()):
+        '''
+        Render a stored record as a JSON API resource object, limited to the sparse fieldset ``fields[type]`` of its
+        type if ``fields`` has one. The relationships named in ``linkage``, those pulled in with include, carry their
+        resource linkage even when they are to-many.
+        '''
+        self_url = '%s/api/v2/%s/%s' % (self.base_url, rec['type'], rec['id'])
+        only = (fields or {}).get(rec['type'])
+        rels = {}
+        for name in registry()[rec['type']].relationships:
+            if only is not None and name not in only:
+                continue
+            entry = {'links': {'self': '%s/relationships/%s' % (self_url, name), 'related': '%s/%s' % (self_url, name)}}
+            # Like Workbench, only to-one relationships carry resource linkage, to-many ones are links only.
+            data = rec['relationships'].get(name)
+            if isinstance(data, tuple):
+                entry['data'] = {'type': data[0], 'id': data[1]}
+            elif name in linkage:
+                entry['data'] = [{'type': ref[0], 'id': ref[1]} for ref in data or []]
+            rels[name] = entry
+        attrs = {k: v for k, v in rec['attributes'].items() if only is None or k in only}
+        return {'type': rec['type'], 'id': rec['id'], 'attributes': attrs,
+                'relationships': rels, 'links': {'self': self_url}}
+
+    def _field_values(self, rec, path):
+        if len(path) == 1:
+            return [rec['id'] if path[0] == 'id' else rec['attributes'].get(path[0])]
+        related = self.store.related(rec, path[0])
+        if not isinstance(related, list):
+            related = [related] if related is not None else []
+        if path[1] == 'id':
+            return [r['id'] for r in related] or [None]
+        return [r['attributes'].get(path[1]) for r in related] or [None]
+
+    def query(self, api_type, params):
+        '''
+        Apply ``filter[...]`` and ``sort`` params to the records of ``api_type``.
+        '''
+        filters = []
+        sorts = []
+        for key, value in params:
+            if key.startswith('filter['):
+                filters.append((key[len('filter['):-1].split(']['), value))
+            elif key == 'sort':
+                sorts.append(value)
+
+        recs = [rec for rec in self.store.records.get(api_type, {}).values()
+                if all(any(_match(v, cond) for v in self._field_values(rec, path)) for path, cond in filters)]
+
+        for key in reversed(sorts or ['+created_at', '+id']):
+            path = [key.lstrip('+-')]
+            recs.sort(key=lambda rec: _sort_key(self._field_values(rec, path)[0]), reverse=key.startswith('-'))
+        return recs
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def log_message(self, format, *args):
+        pass
+
+    def setup(self):
+        super().setup()
+        # Headers and body go out in separate writes, without this every response waits out a delayed ACK.
+        self.connection.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        self.server.workbench._bump('connections')
+
+    @property
+    def wb(self):
+        return self.server.workbench
+
+    def _send(self, status, body=None, headers=None, raw=None):
+        headers = dict(headers or {})
+        payload = raw if raw is not None else (json.dumps(body).encode() if body is not None else b'')
+        if raw is None and body is not None:
+            headers.setdefault('Content-Type', 'application/vnd.api+json')
+            if 'gzip' in self.headers.get('Accept-Encoding', ''):
+                payload = gzip.compress(payload, compresslevel=1)
+                headers['Content-Encoding'] = 'gzip'
+        headers['Content-Length'] = str(len(payload))
+        if self.close_connection:
+            headers['Connection'] = 'close'
+        self.send_response(status)
+        for key, value in headers.items():
+            self.send_header(key, value)
+        self.end_headers()
+        if self.command != 'HEAD':
+            self.wfile.write(payload)
+
+    def _error(self, status, title):
+        self._send(status, {'errors': [{'status': str(status), 'title': title}]})
+
+    def _read_body(self):
+        length = int(self.headers.get('Content-Length') or 0)
+        body = self.rfile.read(length) if length else b''
+        if body and self.headers.get('Content-Encoding') == 'gzip':
+            body = gzip.decompress(body)
+        return body
+
+    def _dispatch(self):
+        self.wb._enter()
+        try:
+            return self._handle()
+        finally:
+            self.wb._bump('in_flight', -1)
+
+    def _handle(self):
+        wb = self.wb
+        n = wb._bump('requests')
+        body = self._read_body()
+        if wb.latency:
+            time.sleep(wb.latency)
+        if wb.throttle_every and n % wb.throttle_every == 0:
+            wb._bump('throttled')
+            return self._send(429, {'errors': [{'status': '429', 'title': 'Too Many Requests'}]}, {'Retry-After': '0'})
+
+        url = urlsplit(self.path)
+        params = parse_qsl(url.query, keep_blank_values=True)
+        parts = [p for p in url.path.split('/') if p]
+
+        if parts[:3] == ['auth', 'v0', 'login']:
+            if 'x-expelinc-otp' not in self.headers:
+                return self._error(401, 'Unauthorized')
+            return self._send(200, {'access_token': 'mock-token'})
+
+        if parts[:2] != ['api', 'v2'] or len(parts) < 3:
+            return self._error(404, 'Not Found')
+        if wb.tokens is not None and self.headers.get('Authorization', '')[len('Bearer '):] not in wb.tokens:
+            return self._error(401, 'Unauthorized')
+        parts = parts[2:]
+
+        if len(parts) == 3 and parts[2] == 'download':
+            return self._download()
+        if len(parts) == 3 and parts[2] == 'upload':
+            if not self.headers.get('Content-Type', '').startswith('multipart/form-data'):
+                return self._error(400, 'Bad Request')
+            return self._send(200, {'data': None})
+
+        api_type = parts[0]
+        if api_type not in registry():
+            return self._error(404, 'Not Found')
+
+        if self.command == 'GET' and len(parts) == 1:
+            return self._collection(api_type, params)
+        if self.command == 'POST' and len(parts) == 1:
+            return self._create(api_type, json.loads(body or b'{}'))
+
+        rec = wb.store.get(api_type, parts[1])
+        if rec is None:
+            return self._error(404, 'Not Found')
+
+        fields = _fieldsets(params)
+        if self.command == 'GET' and len(parts) == 2:
+            return self._send(200, {'data': wb.render(rec, fields)})
+        if self.command == 'GET' and len(parts) == 3:
+            related = wb.store.related(rec, parts[2])
+            if isinstance(related, list):
+                return self._send(200, {'data': [wb.render(r, fields) for r in related]})
+            return self._send(200, {'data': wb.render(related, fields) if related is not None else None})
+        if self.command == 'PATCH' and len(parts) == 2:
+            return self._update(rec, json.loads(body or b'{}'))
+        if self.command == 'DELETE' and len(parts) == 2:
+            with wb.store.lock:
+                wb.store.records[api_type].pop(rec['id'], None)
+            return self._send(204)
+        return self._error(405, 'Method Not Allowed')
+
+    def _collection(self, api_type, params):
+        wb = self.wb
+        recs = wb.query(api_type, params)
+        limit = offset = None
+        includes = []
+        for key, value in params:
+            if key == 'page[limit]':
+                limit = int(value)
+            elif key == 'page[offset]':
+                offset = int(value)
+            elif key == 'include':
+                includes.extend(name for name in value.split(',') if name)
+        limit = wb.page_size if limit is None else limit
+        offset = offset or 0
+
+        fields = _fieldsets(params)
+        page = recs[offset:offset + limit]
+        content = {'data': [wb.render(rec, fields, includes) for rec in page], 'meta': {'page': {'total': len(recs)}},
+                   'links': {'self': wb.base_url + self.path}}
+        if limit and offset + limit < len(recs):
+            next_params = [(k, v) for k, v in params if k not in ('page[offset]', 'page[limit]')]
+            next_params += [('page[limit]', limit), ('page[offset]', offset + limit)]
+            content['links']['next'] = '%s/api/v2/%s?%s' % (wb.base_url, api_type, urlencode(next_params))
+
+        if includes:
+            seen = set()
+            included = []
+            for rec in page:
+                for name in includes:
+                    related = wb.store.related(rec, name)
+                    for r in related if isinstance(related, list) else [related]:
+                        if r is not None and (r['type'], r['id']) not in seen:
+                            seen.add((r['type'], r['id']))
+                            included.append(wb.render(r, fields))
+            content['included'] = included
+        return self._send(200, content)
+
+    def _apply(self, rec, data):
+        rec['attributes'].update(data.get('attributes') or {})
+        for name, rel in (data.get('relationships') or {}).items():
+            rel = rel.get('data')
+            if isinstance(rel, dict):
+                rec['relationships'][name] = (rel['type'], rel['id'])
+            elif isinstance(rel, list):
+                rec['relationships'][name] = [(r['type'], r['id']) for r in rel]
+
+    def _create(self, api_type, body):
+        wb = self.wb
+        with wb.store.lock:
+            rec = wb.store.add(api_type, body.get('id') or str(uuid.uuid4()), {'created_at': wb._tick()})
+            self._apply(rec, body.get('data') or {})
+        return self._send(201, {'data': wb.render(rec)})
+
+    def _update(self, rec, body):
+        with self.wb.store.lock:
+            self._apply(rec, body.get('data') or {})
+        return self._send(200, {'data': self.wb.render(rec)})
+
+    def _download(self):
+        size = self.wb.download_size
+        blob = (self.path.encode() * (size // max(len(self.path), 1) + 1))[:size]
+        rng = self.headers.get('Range')
+        if rng and rng.startswith('bytes='):
+            start, end = rng[len('bytes='):].split('-')
+            start = int(start)
+            end = min(int(end), size - 1) if end else size - 1
+            return self._send(206, raw=blob[start:end + 1], headers={
+                'Content-Type': 'application/octet-stream', 'Content-Range': 'bytes %d-%d/%d' % (start, end, size)})
+        return self._send(200, raw=blob, headers={'Content-Type': 'application/octet-stream'})
+
+    do_GET = do_POST = do_PATCH = do_DELETE = do_HEAD = _dispatch
@@ -0,0 +1,127 @@
+#!/usr/bin/env python
+'''
+Build the timeline of an investigation from every resource type that records something happening in it. Each source
+is searched in its own thread, sorted by its time field and with the relationships a timeline shows included, and the
+sources are merged into one time ordered stream as their pages arrive. The first events are returned once every source
+has answered its first page, and the whole timeline takes about as long as the slowest source rather than the sum.
+
+Examples:
+    >>> for when, record in xc.timeline(inv_id):
+    >>>     print(when, record._api_type, getattr(record, 'comment', None) or getattr(record, 'action', None))
+    >>> # or, from an investigation
+    >>> for when, record in xc.investigations.get(id=inv_id).timeline():
+    >>>     ...
+'''
+import concurrent.futures
+import heapq
+import logging
+import queue
+import threading
+
+from .workbench import include
+from .workbench import parse_timestamp
+from .workbench import relationship
+from .workbench import sort
+
+
+logger = logging.getLogger(__name__)
+
+# (resource type, time field, relationships to include) of every timeline source
+TIMELINE_SOURCES = (
+    ('timeline_entries', 'event_date', ('expel_alert',)),
+    ('comments', 'created_at', ('created_by',)),
+    ('investigative_actions', 'created_at', ('created_by',)),
+    ('expel_alerts', 'created_at', ('vendor',)),
+    ('investigation_histories', 'created_at', ('created_by',)),
+    ('expel_alert_histories', 'created_at', ('created_by',)),
+    ('investigative_action_histories', 'created_at', ('created_by',)),
+)
+
+_DONE = object()
+
+
+class _Failed:
+    __slots__ = ('error',)
+
+    def __init__(self, error):
+        self.error = error
+
+
+def _when(record, field):
+    value = record._attrs.get(field)
+    if isinstance(value, str):
+        return parse_timestamp(value)
+    return value
+
+
+def _key(event):
+    return event[0]
+
+
+def timeline(conn, investigation_id, sources=TIMELINE_SOURCES, buffer=1000):
+    '''
+    Stream the events of an investigation in time order.
+
+    :param conn: The client to search with.
+    :type conn: WorkbenchClient
+    :param investigation_id: The investigation.
+    :type investigation_id: str
+    :param sources: ``(resource type, time field, includes)`` of the resource types to build the timeline from.
+    :type sources: tuple
+    :param buffer: Maximum number of records of any one source fetched ahead of the merge.
+    :type buffer: int
+    :return: ``(time, record)`` tuples, time is a timezone aware datetime, or None for records without one, which come
+        after every timed event.
+    :rtype: generator
+    '''
+    stop = threading.Event()
+    queues = [queue.Queue(maxsize=buffer) for _ in sources]
+
+    def put(q, item):
+        while not stop.is_set():
+            try:
+                q.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def work(q, api_type, field, includes):
+        args = [relationship('investigation.id', investigation_id), sort(field)]
+        if includes:
+            args.append(include(','.join(includes)))
+        try:
+            for record in getattr(conn, api_type).search(*args):
+                if not put(q, (_when(record, field), record)):
+                    return
+        except Exception as e:
+            logger.warning('Timeline source %s of investigation %s failed: %s', api_type, investigation_id, e)
+            put(q, _Failed(e))
+        finally:
+            put(q, _DONE)
+
+    def drain(q, untimed):
+        # Events without a time are held back rather than merged, the database may sort nulls first or last and
+        # heapq.merge needs every source in the order of its key
+        while True:
+            item = q.get()
+            if item is _DONE:
+                return
+            if isinstance(item, _Failed):
+                raise item.error
+            if item[0] is None:
+                untimed.append(item)
+                continue
+            yield item
+
+    pool = concurrent.futures.ThreadPoolExecutor(max_workers=len(sources) or 1)
+    try:
+        for q, (api_type, field, includes) in zip(queues, sources):
+            pool.submit(work, q, api_type, field, includes)
+        untimed = [[] for _ in sources]
+        yield from heapq.merge(*[drain(q, held) for q, held in zip(queues, untimed)], key=_key)
+        for held in untimed:
+            yield from held
+    finally:
+        stop.set()
+        pool.shutdown(wait=True, cancel_futures=True)
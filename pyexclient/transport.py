@@ -0,0 +1,360 @@
+#!/usr/bin/env python
+'''
+HTTP transport settings shared by every request a client makes. :class:`TransportConfig` sizes the connection pools,
+controls keep-alive and content encoding, and selects between the default urllib3 transport and an optional HTTP/2
+transport backed by ``httpx`` (``pip install pyexclient[http2]``).
+
+Examples:
+    >>> transport = TransportConfig(pool_maxsize=32, pool_block=True)
+    >>> xc = WorkbenchClient('https://workbench.expel.io', token=token, transport=transport)
+    >>> ... # run searches from many threads
+    >>> xc.transport_stats()
+    {'requests': 250, 'connections': 32, 'reuse': 0.872}
+'''
+import gzip
+import os
+import ssl
+import threading
+import time
+
+import requests
+from requests.adapters import BaseAdapter
+from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+from requests.utils import select_proxy
+from urllib3.connection import HTTPConnection
+from urllib3.connection import HTTPSConnection
+from urllib3.connectionpool import HTTPConnectionPool
+from urllib3.connectionpool import HTTPSConnectionPool
+from urllib3.util.request import ACCEPT_ENCODING
+
+
+class TransportConfig:
+    '''
+    Connection pool and protocol settings of a client.
+
+    :param pool_connections: Number of hosts to keep a connection pool for.
+    :type pool_connections: int
+    :param pool_maxsize: Maximum connections kept open per host. With ``pool_block`` this is also the per host limit
+        on concurrent requests.
+    :type pool_maxsize: int
+    :param pool_block: Wait for a free connection rather than open, and then discard, one beyond ``pool_maxsize``.
+    :type pool_block: bool
+    :param keep_alive: Reuse connections between requests.
+    :type keep_alive: bool
+    :param http2: Negotiate HTTP/2, multiplexing concurrent requests over few connections. Requires ``httpx[http2]``.
+    :type http2: bool
+    :param accept_encoding: Response encodings to accept. Defaults to every encoding that can be decoded here, brotli
+        and zstd are added when ``pip install pyexclient[compression]`` is installed.
+    :type accept_encoding: str or None
+    :param compress_min_size: Gzip POST, PATCH and PUT bodies of at least this many bytes, never if None.
+    :type compress_min_size: int or None
+    '''
+
+    def __init__(self, pool_connections=10, pool_maxsize=10, pool_block=False, keep_alive=True, http2=False,
+                 accept_encoding=None, compress_min_size=None):
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+        self.pool_block = pool_block
+        self.keep_alive = keep_alive
+        self.http2 = http2
+        self.accept_encoding = accept_encoding or ACCEPT_ENCODING
+        self.compress_min_size = compress_min_size
+
+    def __repr__(self):
+        return ('TransportConfig(pool_connections=%d, pool_maxsize=%d, pool_block=%s, keep_alive=%s, http2=%s, '
+                'accept_encoding=%r, compress_min_size=%r)' % (
+                    self.pool_connections, self.pool_maxsize, self.pool_block, self.keep_alive, self.http2,
+                    self.accept_encoding, self.compress_min_size))
+
+    def encode_body(self, method, data):
+        '''
+        Compress a request body if it is large enough.
+
+        :param method: The HTTP method of the request.
+        :type method: str
+        :param data: The request body.
+        :type data: str or bytes or None
+        :return: The body to send, and its content encoding or None if it is sent as is.
+        :rtype: tuple
+        '''
+        if self.compress_min_size is None or method.upper() not in ('POST', 'PATCH', 'PUT'):
+            return data, None
+        if not isinstance(data, (str, bytes)) or len(data) < self.compress_min_size:
+            return data, None
+        if isinstance(data, str):
+            data = data.encode('utf-8')
+        return gzip.compress(data, compresslevel=6), 'gzip'
+
+    def make_adapter(self, retry):
+        '''
+        Build the adapter the client's session is mounted with.
+
+        :param retry: Retry policy of the client.
+        :type retry: urllib3.util.retry.Retry
+        :return: The transport adapter
+        :rtype: requests.adapters.BaseAdapter
+        '''
+        if self.http2:
+            return Http2Adapter(self, retry)
+        return PooledHTTPAdapter(pool_connections=self.pool_connections, pool_maxsize=self.pool_maxsize,
+                                 pool_block=self.pool_block, max_retries=retry)
+
+
+class WireStats:
+    '''
+    Running totals of request and response body sizes, before and after content encoding. ``wire`` counts are the
+    bytes that crossed the network, the others the bytes the client produced or consumed.
+    '''
+    FIELDS = ('requests', 'sent', 'sent_wire', 'received', 'received_wire')
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        with self._lock:
+            self._totals = dict.fromkeys(self.FIELDS, 0)
+
+    def __reduce__(self):
+        # Totals are per process, an unpickled copy starts from zero
+        return (type(self), ())
+
+    def add(self, sent, sent_wire, received, received_wire):
+        with self._lock:
+            totals = self._totals
+            totals['requests'] += 1
+            totals['sent'] += sent
+            totals['sent_wire'] += sent_wire
+            totals['received'] += received
+            totals['received_wire'] += received_wire
+
+    def snapshot(self):
+        '''
+        :return: The totals, plus the ratio of wire to decoded bytes in each direction.
+        :rtype: dict
+        '''
+        with self._lock:
+            stats = dict(self._totals)
+        stats['sent_ratio'] = round(stats['sent_wire'] / stats['sent'], 3) if stats['sent'] else 1.0
+        stats['received_ratio'] = round(stats['received_wire'] / stats['received'], 3) if stats['received'] else 1.0
+        return stats
+
+
+def body_size(data):
+    if isinstance(data, str):
+        return len(data.encode('utf-8'))
+    if isinstance(data, bytes):
+        return len(data)
+    return 0
+
+
+class _CountingConnectMixin:
+    # urllib3 reconnects a pooled connection object the server closed without creating a new one, so count the
+    # connects themselves (each one a TCP, and for https a TLS, handshake).
+    def connect(self):
+        with self._pool._connects_lock:
+            self._pool.num_connects += 1
+        return super().connect()
+
+
+class _CountingHTTPConnection(_CountingConnectMixin, HTTPConnection):
+    pass
+
+
+class _CountingHTTPSConnection(_CountingConnectMixin, HTTPSConnection):
+    pass
+
+
+class _CountingPoolMixin:
+    def __init__(self, *args, **kwargs):
+        self.num_connects = 0
+        self._connects_lock = threading.Lock()
+        super().__init__(*args, **kwargs)
+
+    def _new_conn(self):
+        conn = super()._new_conn()
+        conn._pool = self
+        return conn
+
+
+class _CountingHTTPConnectionPool(_CountingPoolMixin, HTTPConnectionPool):
+    ConnectionCls = _CountingHTTPConnection
+
+
+class _CountingHTTPSConnectionPool(_CountingPoolMixin, HTTPSConnectionPool):
+    ConnectionCls = _CountingHTTPSConnection
+
+
+class PooledHTTPAdapter(HTTPAdapter):
+    '''
+    :class:`requests.adapters.HTTPAdapter` that reports how well its connection pools are reused.
+    '''
+
+    def init_poolmanager(self, *args, **kwargs):
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {'http': _CountingHTTPConnectionPool,
+                                                   'https': _CountingHTTPSConnectionPool}
+
+    def stats(self):
+        '''
+        :return: Requests issued and connections opened by the adapter's live pools.
+        :rtype: dict
+        '''
+        pools = self.poolmanager.pools
+        reqs = conns = 0
+        for key in list(pools.keys()):
+            pool = pools.get(key)
+            if pool is not None:
+                reqs += pool.num_requests
+                conns += getattr(pool, 'num_connects', pool.num_connections)
+        return {'requests': reqs, 'connections': conns}
+
+
+class _HttpxRaw:
+    '''
+    The file like ``raw`` attribute of a response served by :class:`Http2Adapter`.
+    '''
+
+    def __init__(self, resp, errors):
+        self._resp = resp
+        self._errors = errors
+
+    def stream(self, chunk_size, decode_content=True):
+        try:
+            yield from self._resp.iter_bytes(chunk_size)
+        except self._errors as e:
+            raise requests.exceptions.ChunkedEncodingError(e)
+        finally:
+            self._resp.close()
+
+    def read(self, amt=None):
+        return b''.join(self.stream(amt or 65536))
+
+    def tell(self):
+        return self._resp.num_bytes_downloaded
+
+    def close(self):
+        self._resp.close()
+
+    def release_conn(self):
+        self._resp.close()
+
+
+class Http2Adapter(BaseAdapter):
+    '''
+    Requests adapter backed by an ``httpx`` client with HTTP/2 enabled. Retries the same status codes and methods as
+    ``retry``, honouring ``Retry-After``, with the same exponential backoff. The session's ``verify``, ``cert`` and
+    ``proxies`` settings are applied as they are by the default transport.
+    '''
+
+    def __init__(self, config, retry):
+        super().__init__()
+        try:
+            import httpx
+        except ImportError:
+            raise ImportError('HTTP/2 transport requires httpx, install it with pip install pyexclient[http2]')
+
+        self._httpx = httpx
+        self.retry = retry
+        self._limits = httpx.Limits(max_connections=config.pool_connections * config.pool_maxsize,
+                                    max_keepalive_connections=config.pool_maxsize if config.keep_alive else 0)
+        self._clients = {}
+        self._requests = 0
+        self._connects = 0
+        self._lock = threading.Lock()
+        self.client = self._client(True, None, None)
+
+    def _ssl_context(self, verify, cert):
+        if isinstance(verify, str):
+            # A CA bundle, or a directory of CA certificates, like requests accepts
+            if os.path.isdir(verify):
+                ctx = ssl.create_default_context(capath=verify)
+            else:
+                ctx = ssl.create_default_context(cafile=verify)
+        else:
+            ctx = self._httpx.create_ssl_context(verify=bool(verify))
+        if cert:
+            if isinstance(cert, str):
+                ctx.load_cert_chain(cert)
+            else:
+                ctx.load_cert_chain(*cert)
+        return ctx
+
+    def _client(self, verify, cert, proxy):
+        # httpx applies TLS and proxy settings per client, so there is one client for every combination sent with
+        if isinstance(cert, list):
+            cert = tuple(cert)
+        key = (verify, cert, proxy)
+        with self._lock:
+            client = self._clients.get(key)
+            if client is None:
+                httpx = self._httpx
+                transport = httpx.HTTPTransport(http2=True, limits=self._limits, retries=self.retry.connect or 0,
+                                                verify=self._ssl_context(verify, cert), proxy=proxy)
+                client = self._clients[key] = httpx.Client(http2=True, limits=self._limits, transport=transport)
+            return client
+
+    def stats(self):
+        return {'requests': self._requests, 'connections': self._connects}
+
+    def _trace(self, event, info):
+        # httpcore reports every connect of its pools, count them as _CountingConnectMixin does for urllib3
+        if event.endswith('connect_tcp.complete'):
+            with self._lock:
+                self._connects += 1
+
+    def _timeout(self, timeout):
+        if isinstance(timeout, tuple):
+            connect, read = timeout
+            return self._httpx.Timeout(read, connect=connect)
+        return self._httpx.Timeout(timeout)
+
+    def _send(self, client, request, timeout):
+        httpx = self._httpx
+        req = client.build_request(request.method, request.url, headers=dict(request.headers),
+                                   content=request.body, timeout=self._timeout(timeout),
+                                   extensions={'trace': self._trace})
+        try:
+            resp = client.send(req, stream=True)
+        except httpx.TimeoutException as e:
+            raise requests.exceptions.Timeout(e, request=request)
+        except httpx.TransportError as e:
+            raise requests.exceptions.ConnectionError(e, request=request)
+        with self._lock:
+            self._requests += 1
+        return resp
+
+    def send(self, request, stream=False, timeout=None, verify=True, cert=None, proxies=None):
+        retry = self.retry
+        client = self._client(verify, cert, select_proxy(request.url, proxies or {}))
+        attempt = 0
+        while True:
+            resp = self._send(client, request, timeout)
+            retryable = resp.status_code in (retry.status_forcelist or ()) and request.method.upper() in retry.allowed_methods
+            if not retryable or attempt >= (retry.status or 0):
+                break
+            # Drain the error body so the connection goes back to the pool
+            resp.read()
+            resp.close()
+            delay = resp.headers.get('Retry-After')
+            time.sleep(float(delay) if delay and delay.isdigit() else retry.backoff_factor * (2 ** attempt))
+            attempt += 1
+
+        response = requests.Response()
+        response.status_code = resp.status_code
+        response.reason = resp.reason_phrase
+        response.headers = CaseInsensitiveDict(resp.headers.items())
+        response.encoding = get_encoding_from_headers(response.headers)
+        response.raw = _HttpxRaw(resp, (self._httpx.TransportError,))
+        response.url = request.url
+        response.request = request
+        response.connection = self
+        return response
+
+    def close(self):
+        with self._lock:
+            clients = list(self._clients.values())
+        for client in clients:
+            client.close()
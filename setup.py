@@ -16,8 +16,13 @@ setup(
     version=versioneer.get_version(),
     cmdclass=versioneer.get_cmdclass(),
     packages=['pyexclient'],
+    package_data={'pyexclient': ['schema.json']},
     python_requires='>=3.9',
     install_requires=[
         'requests'
     ],
+    extras_require={
+        'http2': ['httpx[http2]'],
+        'compression': ['urllib3[brotli,zstd]'],
+    },
 )
@@ -1,5 +1,7 @@
 import pytest
 
+from pyexclient.testing import MockWorkbench
+
 
 @pytest.fixture
 def raw_investigation_dict():
@@ -58,3 +60,12 @@ def raw_investigation_dict():
             }
         }
     }
+
+
+@pytest.fixture(scope='session')
+def mock_workbench():
+    '''
+    Local Workbench stand-in shared by the whole test session. Tests must not modify its data.
+    '''
+    with MockWorkbench(page_size=10) as wb:
+        yield wb
@@ -0,0 +1,151 @@
+import base64
+import concurrent.futures
+import itertools
+import json
+import threading
+import time
+
+import pytest
+import requests
+
+from pyexclient.auth import CallbackTokenProvider
+from pyexclient.auth import StaticTokenProvider
+from pyexclient.auth import token_expiry
+from pyexclient.testing import MockWorkbench
+
+
+def _jwt(claims):
+    encode = lambda blob: base64.urlsafe_b64encode(json.dumps(blob).encode()).rstrip(b'=').decode()  # noqa: E731
+    return '%s.%s.sig' % (encode({'alg': 'none'}), encode(claims))
+
+
+def test_token_expiry():
+    assert token_expiry(_jwt({'exp': 1700000000})) == 1700000000
+    assert token_expiry('Bearer ' + _jwt({'exp': 1700000000})) == 1700000000
+    assert token_expiry(_jwt({'sub': 'x'})) is None
+    assert token_expiry('opaque-api-key') is None
+    assert token_expiry('a.!!!.c') is None
+
+
+def test_jwt_lifetime():
+    counter = itertools.count()
+
+    def fetch(lifetime):
+        return lambda: _jwt({'exp': time.time() + lifetime, 'n': next(counter)})
+
+    provider = CallbackTokenProvider(fetch(30), refresh_margin=20)
+    first = provider.authorization()
+    assert first.startswith('Bearer ')
+    assert provider.authorization() == first
+    assert provider.refreshes == 1
+
+    # A token already inside the refresh margin is refreshed on every use
+    provider = CallbackTokenProvider(fetch(10), refresh_margin=20)
+    assert provider.authorization() != provider.authorization()
+    assert provider.refreshes == 2
+
+
+def test_proactive_refresh():
+    counter = itertools.count()
+    provider = CallbackTokenProvider(lambda: ('t%d' % next(counter), 100), refresh_margin=0)
+    assert provider.authorization() == 'Bearer t0'
+    assert provider.authorization() == 'Bearer t0'
+    # The token is now within the refresh margin of expiring
+    provider.refresh_margin = 200
+    assert provider.authorization() == 'Bearer t1'
+    assert provider.refreshes == 2
+
+
+def test_refresh_does_not_block_valid_token():
+    started = threading.Event()
+    release = threading.Event()
+    tokens = iter(['t0', 't1'])
+
+    def fetch():
+        token = next(tokens)
+        if token == 't1':
+            started.set()
+            release.wait(5)
+        return token, 100
+
+    provider = CallbackTokenProvider(fetch, refresh_margin=0)
+    assert provider.authorization() == 'Bearer t0'
+    provider.refresh_margin = 200
+    with concurrent.futures.ThreadPoolExecutor(1) as pool:
+        refreshing = pool.submit(provider.authorization)
+        assert started.wait(5)
+        # The refresh is stuck, the old token is still valid and handed out without waiting for it
+        assert provider.authorization() == 'Bearer t0'
+        release.set()
+        assert refreshing.result() == 'Bearer t1'
+    provider.refresh_margin = 0
+    assert provider.authorization() == 'Bearer t1'
+
+
+def test_failed_refresh_keeps_valid_token():
+    fail = threading.Event()
+
+    def fetch():
+        if fail.is_set():
+            raise ConnectionError('token service down')
+        return 't0', 100
+
+    provider = CallbackTokenProvider(fetch, refresh_margin=0)
+    assert provider.authorization() == 'Bearer t0'
+    fail.set()
+    provider.refresh_margin = 200
+    assert provider.authorization() == 'Bearer t0'
+    assert provider.refreshes == 1
+
+    # Without an unexpired token to fall back on the error is raised
+    expired = CallbackTokenProvider(lambda: ('t0', -1))
+    assert expired.authorization() == 'Bearer t0'
+    expired.callback = fetch
+    with pytest.raises(ConnectionError):
+        expired.authorization()
+
+
+def test_retry_once_on_401():
+    with MockWorkbench(organizations=1, investigations=2, tokens={'t0'}) as wb:
+        counter = itertools.count()
+        provider = CallbackTokenProvider(lambda: 't%d' % next(counter))
+        xc = wb.client(token=None, token_provider=provider)
+        assert xc.investigations.count() == 2
+
+        # Revoke the token, the next request is rejected once and retried with a new one
+        wb.tokens = {'t1'}
+        before = wb.stats['requests']
+        assert xc.investigations.count() == 2
+        assert wb.stats['requests'] - before == 2
+        assert provider.refreshes == 2
+
+        # A token that is never accepted is retried exactly once
+        wb.tokens = set()
+        before = wb.stats['requests']
+        with pytest.raises(requests.exceptions.HTTPError):
+            xc.investigations.count()
+        assert wb.stats['requests'] - before == 2
+        assert provider.refreshes == 3
+
+
+def test_concurrent_401_refreshes_once():
+    with MockWorkbench(organizations=1, investigations=2, tokens={'t0'}, latency=0.01) as wb:
+        counter = itertools.count()
+        provider = CallbackTokenProvider(lambda: 't%d' % next(counter))
+        xc = wb.client(token=None, token_provider=provider)
+        assert xc.investigations.count() == 2
+        wb.tokens = {'t1'}
+        with concurrent.futures.ThreadPoolExecutor(8) as pool:
+            assert list(pool.map(lambda _: xc.investigations.count(), range(16))) == [2] * 16
+        assert provider.refreshes == 2
+
+
+def test_static_token_not_retried():
+    with MockWorkbench(organizations=1, investigations=2, tokens={'good'}) as wb:
+        xc = wb.client(token=None, token_provider=StaticTokenProvider('good'))
+        assert xc.investigations.count() == 2
+        wb.tokens = set()
+        before = wb.stats['requests']
+        with pytest.raises(requests.exceptions.HTTPError):
+            xc.investigations.count()
+        assert wb.stats['requests'] - before == 1
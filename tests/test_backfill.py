@@ -0,0 +1,99 @@
+import datetime
+import json
+import os
+
+import pytest
+
+from pyexclient.backfill import Backfill
+from pyexclient.backfill import main
+from pyexclient.testing import EPOCH
+from pyexclient.workbench import startswith
+
+START = EPOCH
+END = EPOCH + datetime.timedelta(days=1)
+
+
+def _backfill(xc, directory, **kwargs):
+    kwargs.setdefault('max_shard', 20)
+    return Backfill(xc.expel_alert_histories, START, END, str(directory), **kwargs)
+
+
+def test_plan_splits_large_shards(mock_workbench, tmp_path):
+    backfill = _backfill(mock_workbench.client(), tmp_path)
+    shards = backfill.plan()
+    assert len(shards) > 1
+    assert all(shard.count <= 20 for shard in shards)
+    assert sum(shard.count for shard in shards) == len(mock_workbench.records('expel_alert_histories'))
+    # Shards tile the range without gaps or overlaps
+    assert shards[0].start == START and shards[-1].end == END
+    assert all(a.end == b.start for a, b in zip(shards, shards[1:]))
+
+
+def test_run_writes_every_record(mock_workbench, tmp_path):
+    backfill = _backfill(mock_workbench.client(), tmp_path, workers=4)
+    summary = backfill.run()
+    expected = {rec['id'] for rec in mock_workbench.records('expel_alert_histories')}
+    assert summary == {'shards': len(backfill.shards), 'records': len(expected), 'errors': 0}
+
+    records = list(backfill.records())
+    assert len(records) == len(expected)
+    assert {rec['id'] for rec in records} == expected
+    created = [rec['attributes']['created_at'] for rec in records]
+    assert created == sorted(created)
+    assert not [name for name in os.listdir(tmp_path) if name.endswith('.tmp')]
+
+
+def test_resume_skips_done_shards(mock_workbench, tmp_path):
+    xc = mock_workbench.client()
+    _backfill(xc, tmp_path).run()
+
+    before = mock_workbench.stats['requests']
+    backfill = _backfill(xc, tmp_path)
+    summary = backfill.run()
+    assert mock_workbench.stats['requests'] == before
+    assert summary['records'] == len(mock_workbench.records('expel_alert_histories'))
+
+    with pytest.raises(ValueError):
+        _backfill(xc, tmp_path, field='updated_at').plan()
+
+
+def test_resume_with_filters(mock_workbench, tmp_path):
+    xc = mock_workbench.client()
+    first = _backfill(xc, tmp_path, filters={'action': startswith('STATUS')}).run()
+    assert first['records'] == len(mock_workbench.records('expel_alert_histories'))
+
+    before = mock_workbench.stats['requests']
+    assert _backfill(xc, tmp_path, filters={'action': startswith('STATUS')}).run() == first
+    assert mock_workbench.stats['requests'] == before
+
+    with pytest.raises(ValueError):
+        _backfill(xc, tmp_path, filters={'action': startswith('CHANGED')}).plan()
+
+
+def test_failed_shard_retried(mock_workbench, tmp_path):
+    class FlakyBackfill(Backfill):
+        failed = False
+
+        def _fetch(self, shard):
+            if not FlakyBackfill.failed:
+                FlakyBackfill.failed = True
+                raise ConnectionError('shard fails')
+            return super()._fetch(shard)
+
+    xc = mock_workbench.client()
+    backfill = FlakyBackfill(xc.expel_alert_histories, START, END, str(tmp_path), max_shard=20)
+    summary = backfill.run()
+    assert summary['errors'] == 1 and len(backfill.errors) == 1
+    assert sum(not shard.done for shard in backfill.shards) == 1
+
+    summary = _backfill(xc, tmp_path).run()
+    assert summary['errors'] == 0
+    assert summary['records'] == len(mock_workbench.records('expel_alert_histories'))
+
+
+def test_main(mock_workbench, tmp_path, capsys):
+    assert main(['investigation_histories', '--start', '2020-01-01', '--end', '2020-01-02', '--out', str(tmp_path),
+                 '--base-url', mock_workbench.base_url, '--token', 'mock-token', '--max-shard', '5']) == 0
+    summary = json.loads(capsys.readouterr().out)
+    assert summary['records'] == len(mock_workbench.records('investigation_histories'))
+    assert os.path.exists(os.path.join(tmp_path, 'investigation_histories', 'checkpoint.json'))
@@ -0,0 +1,114 @@
+'''
+Throughput benchmarks against the local Workbench stand-in. Track them across releases with pytest-benchmark:
+
+    pytest tests/test_benchmarks.py --benchmark-autosave
+    pytest tests/test_benchmarks.py --benchmark-compare
+'''
+import io
+from types import SimpleNamespace
+
+import pytest
+
+from pyexclient.cache import RecordCache
+from pyexclient.evidence import EvidenceFlattener
+from pyexclient.evidence import EvidenceTable
+from pyexclient.testing import MockWorkbench
+from pyexclient.workbench import neq
+from pyexclient.workbench import window
+
+pytest.importorskip('pytest_benchmark')
+
+
+@pytest.fixture(scope='module')
+def bench_workbench():
+    with MockWorkbench(organizations=4, investigations=25, page_size=100) as wb:
+        yield wb
+
+
+@pytest.fixture
+def xc(bench_workbench):
+    return bench_workbench.client()
+
+
+@pytest.mark.benchmark(group='search')
+def test_search_iteration(benchmark, xc, bench_workbench):
+    total = len(bench_workbench.records('expel_alerts'))
+    result = benchmark.pedantic(lambda: sum(1 for _ in xc.expel_alerts.search()), rounds=5)
+    assert result == total
+
+
+@pytest.mark.benchmark(group='search')
+def test_search_iteration_vendor_alerts(benchmark, xc, bench_workbench):
+    total = len(bench_workbench.records('vendor_alerts'))
+    result = benchmark.pedantic(lambda: sum(1 for _ in xc.vendor_alerts.search()), rounds=5)
+    assert result == total
+
+
+@pytest.mark.benchmark(group='attributes')
+def test_attribute_reads(benchmark, xc):
+    eas = list(xc.expel_alerts.search())[:100]
+
+    def _read():
+        for _ in range(100):
+            for ea in eas:
+                ea.expel_name, ea.expel_severity, ea.status, ea.created_at
+    benchmark.pedantic(_read, rounds=5)
+    # 40,000 attribute reads a round
+    benchmark.extra_info['reads_per_second'] = int(40000 / benchmark.stats.stats.mean)
+
+
+@pytest.mark.benchmark(group='cache')
+def test_cached_search(benchmark, xc, bench_workbench):
+    cache = RecordCache(xc.expel_alerts)
+    created = sorted(ea['attributes']['created_at'] for ea in bench_workbench.records('expel_alerts'))
+    cache.sync()
+    start, end = created[len(created) // 4], created[len(created) // 2]
+    benchmark(lambda: cache.search(created_at=window(start, end), status=neq('CLOSED')))
+    assert cache.misses == 0
+
+
+@pytest.mark.benchmark(group='lazy')
+def test_lazy_load(benchmark, xc):
+    eas = list(xc.expel_alerts.search())[:100]
+
+    def _load():
+        for ea in eas:
+            ea._relobjs.clear()
+            ea.investigation.title
+    benchmark.pedantic(_load, rounds=3)
+
+
+@pytest.mark.benchmark(group='write')
+def test_save(benchmark, xc):
+    inv = xc.investigations.search().one_or_none()
+
+    def _save():
+        for i in range(50):
+            inv.title = 'title %d' % i
+            inv.save()
+    benchmark.pedantic(_save, rounds=3)
+
+
+@pytest.mark.benchmark(group='download')
+def test_download(benchmark, xc, bench_workbench):
+    bench_workbench.download_size = 4 * 1024 * 1024
+    ia = xc.investigative_actions.search().one_or_none()
+    written = benchmark.pedantic(lambda: ia.download(io.BytesIO()), rounds=5)
+    assert written == bench_workbench.download_size
+
+
+def _deep_evidence(seed, depth=12, width=3):
+    # Evidence the shape of an EDR process tree: each process has a few attributes, a command line and its parent
+    node = {'name': 'proc-%d.exe' % seed, 'pid': seed}
+    for level in range(depth):
+        node = {'name': 'proc-%d.exe' % level, 'pid': seed + level, 'args': ['/c', 'arg-%d' % level] * width,
+                'user': {'name': 'user-%d' % (seed % 7), 'domain': 'CORP'}, 'parent': node}
+    return [{'process': node, 'host': {'name': 'host-%d' % seed, 'ip': '10.0.0.%d' % (seed % 255)}}]
+
+
+@pytest.mark.benchmark(group='evidence')
+def test_flatten_deep_evidence(benchmark):
+    vas = [SimpleNamespace(id=i, evidence_summary=_deep_evidence(i)) for i in range(1000)]
+    table = benchmark.pedantic(lambda: EvidenceTable(EvidenceFlattener()).extend(vas), rounds=3)
+    assert len(table) == 1000
+    assert table.count('process.parent.parent.name') == 1000
@@ -0,0 +1,133 @@
+import datetime
+import time
+
+import pytest
+
+from pyexclient.cache import RecordCache
+from pyexclient.testing import MockWorkbench
+from pyexclient.workbench import contains
+from pyexclient.workbench import gt
+from pyexclient.workbench import isnull
+from pyexclient.workbench import limit
+from pyexclient.workbench import lt
+from pyexclient.workbench import neq
+from pyexclient.workbench import notnull
+from pyexclient.workbench import relationship
+from pyexclient.workbench import startswith
+from pyexclient.workbench import window
+
+
+def _ids(records):
+    return [record.id for record in records]
+
+
+@pytest.mark.parametrize('kwargs', [
+    {},
+    {'status': 'OPEN'},
+    {'status': neq('OPEN')},
+    {'expel_name': startswith('Alert 0-1')},
+    {'expel_name': contains('-1-')},
+    {'close_comment': isnull()},
+    {'close_comment': notnull()},
+    {'is_auto_add': False},
+])
+def test_matches_server(mock_workbench, kwargs):
+    xc = mock_workbench.client()
+    cache = RecordCache(xc.expel_alerts)
+    cache.sync()
+    assert _ids(cache.search(**kwargs)) == _ids(xc.expel_alerts.search(**kwargs))
+    assert cache.hits == 1 and cache.misses == 0
+
+
+def test_window_index(mock_workbench):
+    xc = mock_workbench.client()
+    cache = RecordCache(xc.expel_alerts)
+    created = sorted(ea['attributes']['created_at'] for ea in mock_workbench.records('expel_alerts'))
+    start, end = created[10], created[40]
+
+    assert _ids(cache.search(created_at=window(start, end))) == _ids(xc.expel_alerts.search(created_at=window(start, end)))
+    assert cache.misses == 1 and len(cache) == 29
+
+    # Narrower windows and other filters are answered from memory
+    searches = [{'created_at': window(created[20], created[30])},
+                {'created_at': window(created[35], end), 'status': 'OPEN'},
+                {'created_at': window(start, end), 'status': neq('OPEN')}]
+    before = mock_workbench.stats['requests']
+    local = [cache.search(**kwargs) for kwargs in searches]
+    assert mock_workbench.stats['requests'] == before
+    assert cache.hits == 3 and cache.misses == 1
+    for kwargs, records in zip(searches, local):
+        assert _ids(records) == _ids(xc.expel_alerts.search(**kwargs))
+
+    # Reaching outside the mirrored window fetches again
+    assert _ids(cache.search(created_at=lt(created[5]))) == _ids(xc.expel_alerts.search(created_at=lt(created[5])))
+    assert cache.misses == 2
+
+
+def test_relationship_and_ids(mock_workbench):
+    xc = mock_workbench.client()
+    cache = RecordCache(xc.expel_alerts)
+    cache.sync()
+    inv = xc.investigations.search().one_or_none()
+    expected = xc.expel_alerts.search(relationship('investigation.id', inv.id))
+    assert _ids(cache.search(relationship('investigation.id', inv.id))) == _ids(expected)
+    ids = _ids(cache.search())[:3]
+    assert _ids(cache.search(id=','.join(ids))) == ids
+    assert cache.misses == 0
+
+    with pytest.raises(ValueError):
+        cache.search(relationship('investigation.title', 'x'))
+    with pytest.raises(ValueError):
+        cache.search(limit(5))
+    with pytest.raises(ValueError):
+        cache.search(nope='x')
+
+
+def test_ttl():
+    with MockWorkbench(organizations=1, investigations=2) as wb:
+        xc = wb.client()
+        cache = RecordCache(xc.investigations, ttl=0.1)
+        assert cache.sync() == 2
+        assert cache.count() == 2
+        inv = xc.investigations.search().one_or_none()
+        inv.title = 'renamed'
+        inv.save()
+        assert cache.count(title='renamed') == 0
+        time.sleep(0.15)
+        assert cache.count(title='renamed') == 1
+        assert cache.misses == 1
+
+
+def test_unbounded_searches(mock_workbench):
+    xc = mock_workbench.client()
+    cache = RecordCache(xc.expel_alerts)
+    created = sorted(ea['attributes']['created_at'] for ea in mock_workbench.records('expel_alerts'))
+
+    # Without a window on the field the search goes to Workbench, nothing is mirrored
+    assert _ids(cache.search(status='OPEN')) == _ids(xc.expel_alerts.search(status='OPEN'))
+    assert cache.misses == 1 and len(cache) == 0
+
+    # A search for one value only fetches the records holding it, and is answered from memory next time
+    expected = _ids(xc.expel_alerts.search(created_at=created[7]))
+    assert _ids(cache.search(created_at=created[7])) == expected
+    assert len(cache) == len(expected) and cache.misses == 2
+    assert _ids(cache.search(created_at=created[7])) == expected
+    assert cache.hits == 1
+    assert _ids(cache.search(created_at=created[8])) == _ids(xc.expel_alerts.search(created_at=created[8]))
+    assert cache.misses == 3
+
+
+def test_typed_records(mock_workbench):
+    xc = mock_workbench.client(typed=True)
+    cache = RecordCache(xc.expel_alerts)
+    cache.sync()
+    alerts = cache.search()
+    # Only some attributes are decoded, the rest are still raw strings
+    for ea in alerts[::2]:
+        ea.created_at
+    start, end = alerts[10].created_at, alerts[41].created_at
+    assert isinstance(start, datetime.datetime)
+    for kwargs in ({'created_at': gt(start)}, {'created_at': lt(end)}, {'created_at': window(start, end)},
+                   {'created_at': start}, {'created_at': neq(start)}):
+        assert _ids(cache.search(**kwargs)) == _ids(xc.expel_alerts.search(**kwargs))
+    assert _ids(cache.search(created_at=gt(start))) == _ids(alerts[11:])
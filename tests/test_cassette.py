@@ -0,0 +1,99 @@
+import gzip
+import io
+import time
+
+import pytest
+
+from pyexclient.cassette import Cassette
+from pyexclient.cassette import CassetteError
+from pyexclient.cassette import REDACTED
+from pyexclient.testing import MockWorkbench
+from pyexclient.workbench import WorkbenchClient
+
+
+def _session(xc):
+    invs = [(inv.id, inv.title) for inv in xc.investigations.search()]
+    ea = xc.expel_alerts.search().one_or_none()
+    return invs, ea.investigation.title, [va.id for va in ea.vendor_alerts]
+
+
+def test_record_and_replay(tmp_path, mock_workbench):
+    path = str(tmp_path / 'session.jsonl.gz')
+    with Cassette(path, mode='record') as cassette:
+        recorded = _session(mock_workbench.client(cassette=cassette))
+    assert cassette.interactions
+
+    before = mock_workbench.stats['requests']
+    with Cassette(path) as cassette:
+        # Any host works, requests never leave the process.
+        xc = WorkbenchClient('http://workbench.invalid', token='ignored', cassette=cassette)
+        assert _session(xc) == recorded
+    assert mock_workbench.stats['requests'] == before
+
+
+def test_replay_miss(tmp_path, mock_workbench):
+    path = str(tmp_path / 'session.jsonl.gz')
+    with Cassette(path, mode='record') as cassette:
+        mock_workbench.client(cassette=cassette).investigations.search().count()
+
+    cassette = Cassette(path)
+    xc = WorkbenchClient('http://workbench.invalid', token='ignored', cassette=cassette)
+    assert xc.investigations.search().count() == 20
+    with pytest.raises(CassetteError):
+        xc.investigations.search().count()
+    cassette.rewind()
+    assert xc.investigations.search().count() == 20
+
+
+def test_redaction_and_realtime(tmp_path):
+    path = str(tmp_path / 'session.jsonl.gz')
+    with MockWorkbench(organizations=1, investigations=1, latency=0.05) as wb:
+        with Cassette(path, mode='record') as cassette:
+            xc = WorkbenchClient(wb.base_url, username='u', password='hunter2', mfa_code=123, cassette=cassette)
+            xc.investigations.search().count()
+
+    with gzip.open(path, 'rt') as fd:
+        raw = fd.read()
+    assert 'hunter2' not in raw
+    assert 'mock-token' not in raw
+    assert REDACTED in raw
+
+    def replay(realtime):
+        cassette = Cassette(path, realtime=realtime)
+        start = time.monotonic()
+        xc = WorkbenchClient('http://workbench.invalid', username='u', password='p', mfa_code=1, cassette=cassette)
+        assert xc.investigations.search().count() == 1
+        return time.monotonic() - start
+
+    assert replay(True) >= 0.1
+    assert replay(False) < 0.05
+
+
+def test_replay_download(tmp_path):
+    path = str(tmp_path / 'session.jsonl.gz')
+    with MockWorkbench(organizations=1, investigations=1, download_size=4096) as wb:
+        with Cassette(path, mode='record') as cassette:
+            ia = wb.client(cassette=cassette).investigative_actions.search().one_or_none()
+            recorded = io.BytesIO()
+            ia.download(recorded)
+
+    cassette = Cassette(path)
+    ia = WorkbenchClient('http://workbench.invalid', token='t', cassette=cassette).investigative_actions.search().one_or_none()
+    replayed = io.BytesIO()
+    assert ia.download(replayed) == 4096
+    assert replayed.getvalue() == recorded.getvalue()
+
+
+def test_replay_matches_reordered_query(tmp_path, mock_workbench):
+    path = str(tmp_path / 'session.jsonl.gz')
+    url = '/api/v2/investigations?filter[is_incident]=true&page[limit]=2&sort=%2Btitle&sort=-created_at'
+    with Cassette(path, mode='record') as cassette:
+        recorded = mock_workbench.client(cassette=cassette).request('get', url).json()
+
+    with Cassette(path) as cassette:
+        xc = WorkbenchClient('http://workbench.invalid', token='ignored', cassette=cassette)
+        # Repeated params are matched in order, a different sort order is a different request
+        with pytest.raises(CassetteError):
+            xc.request('get', '/api/v2/investigations?filter[is_incident]=true&page[limit]=2&sort=-created_at&sort=%2Btitle')
+        reordered = '/api/v2/investigations?sort=%2Btitle&page[limit]=2&sort=-created_at&filter[is_incident]=true'
+        assert xc.request('get', reordered).json() == recorded
@@ -0,0 +1,139 @@
+import concurrent.futures
+import threading
+import time
+
+from pyexclient.testing import MockWorkbench
+from pyexclient.transport import TransportConfig
+
+
+LATENCY = 0.02
+REQUESTS = 48
+
+
+def _count(xc, threads):
+    with concurrent.futures.ThreadPoolExecutor(threads) as pool:
+        counts = list(pool.map(lambda _: xc.investigations.count(), range(REQUESTS)))
+    assert counts == [2] * REQUESTS
+
+
+def test_requests_overlap_with_threads():
+    with MockWorkbench(organizations=1, investigations=2, latency=LATENCY) as wb:
+        xc = wb.client(transport=TransportConfig(pool_maxsize=8, pool_block=True))
+        for threads in (1, 2, 4, 8):
+            wb.stats['peak_in_flight'] = 0
+            _count(xc, threads)
+            # Each thread keeps one request in flight, the pool never lets more than that through
+            if threads == 1:
+                assert wb.stats['peak_in_flight'] == 1
+            else:
+                assert 1 < wb.stats['peak_in_flight'] <= threads
+        stats = xc.transport_stats()
+        assert stats['requests'] == REQUESTS * 4
+        assert stats['connections'] <= 8
+
+
+def test_thread_sessions_share_pool(mock_workbench):
+    xc = mock_workbench.client()
+    sessions = {}
+
+    def work(i):
+        sessions[threading.get_ident()] = xc._thread_session()
+        return xc.investigations.count()
+
+    with concurrent.futures.ThreadPoolExecutor(4) as pool:
+        list(pool.map(work, range(16)))
+    assert len({id(s) for s in sessions.values()}) == len(sessions) > 1
+    adapter = xc.session.get_adapter(mock_workbench.base_url)
+    assert all(s.get_adapter(mock_workbench.base_url) is adapter for s in sessions.values())
+    assert all(s.headers is xc.session.headers for s in sessions.values())
+
+    # A new session is picked up by every thread
+    xc.make_session()
+    assert xc._thread_session().get_adapter(mock_workbench.base_url) is not adapter
+
+
+def test_close_releases_every_session(mock_workbench):
+    xc = mock_workbench.client()
+    sessions = []
+
+    def work(i):
+        sessions.append(xc._thread_session())
+        return xc.investigations.count()
+
+    with concurrent.futures.ThreadPoolExecutor(4) as pool:
+        list(pool.map(work, range(16)))
+    old = xc.session.get_adapter(mock_workbench.base_url)
+    # A new session leaves the old pool open for requests other threads still have in flight on it
+    xc.make_session()
+    assert old.poolmanager.pools
+    assert all(session in xc._sessions for session in sessions)
+
+    new = xc.session.get_adapter(mock_workbench.base_url)
+    assert xc.investigations.count() == 20
+    xc.close()
+    assert not old.poolmanager.pools and not new.poolmanager.pools
+    assert not xc._sessions and xc.session is None
+    # A closed client makes a new session when it is used again
+    assert xc.investigations.count() == 20
+
+
+def test_concurrent_lazy_load_coalesced():
+    with MockWorkbench(organizations=1, investigations=1, latency=0.05) as wb:
+        xc = wb.client()
+        ea = xc.expel_alerts.search().one_or_none()
+        before = wb.stats['requests']
+        with concurrent.futures.ThreadPoolExecutor(8) as pool:
+            invs = list(pool.map(lambda _: ea.investigation, range(16)))
+        assert len({id(inv) for inv in invs}) == 1
+        with concurrent.futures.ThreadPoolExecutor(8) as pool:
+            titles = list(pool.map(lambda inv: inv.title, invs))
+        assert wb.stats['requests'] - before == 1
+        assert titles == ['Investigation 0-0'] * 16
+
+
+def test_concurrent_proxy_fetch_coalesced():
+    with MockWorkbench(organizations=1, investigations=1, latency=0.05) as wb:
+        xc = wb.client()
+        eas = list(xc.expel_alerts.search())
+        before = wb.stats['requests']
+        # Every alert has its own proxy of the same investigation, they share one fetch
+        with concurrent.futures.ThreadPoolExecutor(3) as pool:
+            titles = list(pool.map(lambda ea: ea.investigation.title, eas))
+        assert wb.stats['requests'] - before == 1
+        assert titles == ['Investigation 0-0'] * 3
+
+
+class FlakyConn:
+    '''
+    Fails the first request, slowly enough for other threads to queue up behind it.
+    '''
+
+    def __init__(self, conn):
+        self.conn = conn
+        self.calls = 0
+
+    def request(self, *args, **kwargs):
+        self.calls += 1
+        if self.calls == 1:
+            time.sleep(0.1)
+            raise ConnectionError('first request fails')
+        return self.conn.request(*args, **kwargs)
+
+
+def test_concurrent_lazy_load_failure_retried(mock_workbench):
+    xc = mock_workbench.client()
+    ea = xc.expel_alerts.search().one_or_none()
+    ea._conn = FlakyConn(xc)
+    errors = []
+
+    def read():
+        try:
+            return ea.investigation.title
+        except ConnectionError as e:
+            errors.append(e)
+
+    with concurrent.futures.ThreadPoolExecutor(4) as pool:
+        results = list(pool.map(lambda _: read(), range(4)))
+    # The first load fails, the threads waiting on it load the relationship themselves
+    assert len(errors) == 1
+    assert sum(r is not None for r in results) == 3
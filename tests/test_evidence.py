@@ -0,0 +1,125 @@
+import sys
+
+from pyexclient.evidence import EvidenceFlattener
+from pyexclient.evidence import EvidenceIndex
+from pyexclient.evidence import EvidenceTable
+
+
+def _nested(depth):
+    blob = 'leaf'
+    for i in range(depth):
+        blob = {'k%d' % (i % 3): blob} if i % 2 else [blob]
+    return blob
+
+
+def test_flatten():
+    flattener = EvidenceFlattener()
+    assert flattener.flatten({'a': 'b', 'c': ['a', 'b', {'d': 'e'}]}) == {'a': 'b', 'c.0': 'a', 'c.1': 'b', 'c.2.d': 'e'}
+    assert flattener.flatten({'a': {}, 'b': [], 'c': None}) == {'c': None}
+    assert list(flattener.flatten({'z': 1, 'a': {'y': 2, 'b': 3}, 'm': 4})) == ['z', 'a.y', 'a.b', 'm']
+    assert EvidenceFlattener(sep='/').flatten({'a': {'b': 1}}) == {'a/b': 1}
+
+
+def test_flatten_deep():
+    depth = sys.getrecursionlimit() * 2
+    flat = EvidenceFlattener().flatten(_nested(depth))
+    assert list(flat.values()) == ['leaf']
+    assert list(flat)[0].count('.') == depth - 1
+
+
+def test_paths_interned():
+    flattener = EvidenceFlattener()
+    first = flattener.flatten_evidence([{'host': {'name': 'a'}}])
+    second = flattener.flatten_evidence([{'host': {'name': 'b'}}])
+    assert next(iter(first)) is next(iter(second))
+
+    flattener = EvidenceFlattener(max_paths=1)
+    assert flattener.flatten({'a': {'b': 1}, 'c': 2}) == {'a.b': 1, 'c': 2}
+    assert len(flattener._paths) == 1
+
+
+def test_flatten_evidence():
+    flattener = EvidenceFlattener()
+    summary = [{'evidence_source': 'edr', 'host': {'name': 'a', 'ip': '10.0.0.1'}}, {'host': {'name': 'b'}}]
+    assert flattener.flatten_evidence(summary) == {'evidence_source': 'edr', 'host.name': 'b', 'host.ip': '10.0.0.1'}
+    assert flattener.flatten_evidence({'host': {'name': 'a'}}) == {'host.name': 'a'}
+    assert flattener.flatten_evidence(None) == {}
+    assert flattener.flatten_evidence([None, {}]) == {}
+
+
+def test_table():
+    table = EvidenceTable()
+    assert table.add('va1', [{'host': {'name': 'a'}}]) == 0
+    table.add('va2', None)
+    table.add('va3', [{'host': {'name': 'c', 'ip': '10.0.0.3'}}])
+    assert len(table) == 3
+    assert table.ids == ['va1', 'va2', 'va3']
+    assert table.columns == ['host.name', 'host.ip']
+    assert table.column('host.name') == ['a', None, 'c']
+    assert table.column('host.ip', default='') == ['', '', '10.0.0.3']
+    assert table.column('nope') == [None, None, None]
+    assert table.count('host.ip') == 1
+    assert table.row(2) == {'host.name': 'c', 'host.ip': '10.0.0.3'}
+    assert table.row(1) == {}
+
+
+def test_table_from_search(mock_workbench):
+    xc = mock_workbench.client()
+    table = EvidenceTable().extend(xc.vendor_alerts.search())
+    vas = mock_workbench.records('vendor_alerts')
+    assert len(table) == len(vas)
+    by_id = {va['id']: va['attributes']['evidence_summary'][0] for va in vas}
+    assert table.column('host.name') == [by_id[va_id]['host']['name'] for va_id in table.ids]
+    assert table.column('process.args.1') == ['whoami'] * len(vas)
+
+
+def test_index():
+    index = EvidenceIndex()
+    index.add('ea1', 'HOSTNAME', 'Host-A')
+    index.add('ea1', 'SOURCE_IP', '10.0.0.1')
+    index.add('ea2', 'HOSTNAME', 'host-a')
+    index.add('ea2', 'SOURCE_IP', '10.0.0.2')
+    index.add('ea3', 'SOURCE_IP', '10.0.0.1')
+    index.add('ea3', 'USERNAME', '10.0.0.1')
+    assert len(index) == 3
+    assert index.types == ['HOSTNAME', 'SOURCE_IP', 'USERNAME']
+    assert index.lookup('HOSTNAME', 'HOST-A') == {'ea1', 'ea2'}
+    assert index.lookup('HOSTNAME', 'nope') == frozenset()
+    assert index.find('10.0.0.1') == {'SOURCE_IP': {'ea1', 'ea3'}, 'USERNAME': {'ea3'}}
+    assert index.intersect(('HOSTNAME', 'host-a'), ('SOURCE_IP', '10.0.0.1')) == {'ea1'}
+    assert index.intersect() == frozenset()
+    assert index.union(('HOSTNAME', 'host-a'), ('SOURCE_IP', '10.0.0.1')) == {'ea1', 'ea2', 'ea3'}
+    assert index.evidence_of('ea3') == {('SOURCE_IP', '10.0.0.1'), ('USERNAME', '10.0.0.1')}
+    assert index.correlated('ea1') == {'ea2': 1, 'ea3': 1}
+    assert index.correlated('ea1', evidence_types=['HOSTNAME']) == {'ea2': 1}
+    assert EvidenceIndex(casefold=False).lookup('HOSTNAME', 'x') == frozenset()
+
+
+def test_index_save_load(tmp_path):
+    index = EvidenceIndex(casefold=False)
+    index.add('ea1', 'HOSTNAME', 'Host-A')
+    index.add('ea2', 'HOSTNAME', 'Host-A')
+    index.save(str(tmp_path / 'index.jsonl.gz'))
+    loaded = EvidenceIndex.load(str(tmp_path / 'index.jsonl.gz'))
+    assert not loaded.casefold
+    assert loaded.lookup('HOSTNAME', 'Host-A') == {'ea1', 'ea2'}
+    assert loaded.evidence_of('ea2') == {('HOSTNAME', 'Host-A')}
+
+
+def test_index_from_search(mock_workbench):
+    xc = mock_workbench.client()
+    index = EvidenceIndex()
+    before = mock_workbench.stats['requests']
+    evs = mock_workbench.records('vendor_alert_evidences')
+    assert index.update_from(xc) == len(evs)
+    # One request per page, the alerts of each evidence come from its resource linkage
+    assert mock_workbench.stats['requests'] - before == -(-len(evs) // mock_workbench.page_size)
+
+    for ev in evs:
+        alert_ids = {ref[1] for ref in ev['relationships']['evidenced_expel_alerts']}
+        assert alert_ids <= index.lookup(ev['attributes']['evidence_type'], ev['attributes']['evidence'])
+    host = next(ev['attributes']['evidence'] for ev in evs if ev['attributes']['evidence_type'] == 'HOSTNAME')
+    expected = {ea['id'] for ea in mock_workbench.records('expel_alerts')
+                if any(ev['attributes']['evidence'] == host
+                       for ev in (mock_workbench.store.get(*ref) for ref in ea['relationships'].get('evidence', [])))}
+    assert index.lookup('HOSTNAME', host) == expected
@@ -0,0 +1,187 @@
+import threading
+import time
+
+import pytest
+import requests
+
+from pyexclient import fanout
+from pyexclient.fanout import _TenantConn
+from pyexclient.fanout import FanOut
+from pyexclient.fanout import RateLimiter
+from pyexclient.fanout import TenantDeadlineExceeded
+from pyexclient.testing import MockWorkbench
+from pyexclient.transport import TransportConfig
+from pyexclient.workbench import param
+from pyexclient.workbench import relationship
+
+
+def test_fanout_org_ids(mock_workbench):
+    xc = mock_workbench.client()
+    org_ids = [org['id'] for org in mock_workbench.records('organizations')]
+    template = xc.investigations.prepare(relationship('organization.id', param('org')))
+
+    fan = FanOut(template, workers=4)
+    results = list(fan.run(org_ids, client=xc))
+    assert len(results) == 20
+    assert not fan.errors
+    assert fan.counts == {org_id: 10 for org_id in org_ids}
+    for org_id, inv in results:
+        assert inv.relationship.organization.id == org_id
+
+
+def test_fanout_tokens(mock_workbench):
+    xc = mock_workbench.client()
+    fan = FanOut(xc.investigations.prepare(is_incident=True))
+    results = list(fan.run({'a': 'token-a', 'b': mock_workbench.client()}, client=xc))
+    assert sorted(tenant for tenant, _ in results) == ['a'] * 4 + ['b'] * 4
+
+
+def test_fanout_token_clients_keep_settings(mock_workbench):
+    xc = mock_workbench.client(typed=True, transport=TransportConfig(pool_maxsize=4))
+    xc.retries = 1
+    fan = FanOut(lambda conn, tenant: [conn])
+    (_, conn), = fan.run({'a': 'token-a'}, client=xc)
+    assert conn is not xc
+    assert conn.typed and conn.retries == 1 and conn.transport is xc.transport
+    assert conn._ensure_session().headers['Authorization'] == 'Bearer token-a'
+    assert conn.investigations.search().one_or_none().created_at.tzinfo is not None
+
+
+def test_fanout_isolates_failures():
+    release = threading.Event()
+
+    def template(conn, tenant):
+        if tenant == 'bad':
+            raise ValueError('boom')
+        if tenant == 'slow':
+            release.wait(5)
+        for i in range(3):
+            yield i
+
+    fan = FanOut(template, workers=3)
+    seen = []
+    for tenant, result in fan.run(['slow', 'bad', 'good'], client=object()):
+        seen.append(tenant)
+        if seen.count('good') == 3:
+            release.set()
+    # The slow tenant is only released once the good one is done, so its results come last
+    assert seen == ['good'] * 3 + ['slow'] * 3
+    assert isinstance(fan.errors['bad'], ValueError)
+    assert fan.counts == {'slow': 3, 'bad': 0, 'good': 3}
+
+
+def test_fanout_deadline():
+    def template(conn, tenant):
+        for i in range(10):
+            time.sleep(0.05)
+            yield i
+
+    fan = FanOut(template, deadline=0.12)
+    results = list(fan.run(['t'], client=object()))
+    assert 0 < len(results) < 10
+    assert isinstance(fan.errors['t'], TenantDeadlineExceeded)
+
+
+def test_fanout_deadline_stuck_tenant():
+    release = threading.Event()
+
+    def template(conn, tenant):
+        if tenant == 'stuck':
+            release.wait(10)
+        yield tenant
+
+    fan = FanOut(template, deadline=0.1)
+    start = time.monotonic()
+    try:
+        assert list(fan.run(['stuck', 'ok'], client=object())) == [('ok', 'ok')]
+        assert time.monotonic() - start < 5
+    finally:
+        release.set()
+    assert isinstance(fan.errors['stuck'], TenantDeadlineExceeded)
+    assert fan.counts == {'stuck': 0, 'ok': 1}
+
+
+def test_fanout_deadline_times_out_requests():
+    with MockWorkbench(organizations=1, investigations=1, latency=0.5) as wb:
+        xc = wb.client()
+        xc.retries = 0
+        xc.make_session()
+        fan = FanOut(lambda conn, tenant: conn.investigations.search(), deadline=0.1)
+        assert list(fan.run(['a'], client=xc)) == []
+        assert isinstance(fan.errors['a'], TenantDeadlineExceeded)
+
+        # The request in flight is timed out at the deadline
+        conn = _TenantConn(xc, 'a', deadline=0.1, deadline_at=time.monotonic() + 0.1)
+        with pytest.raises(TenantDeadlineExceeded) as exc:
+            conn.request('get', '/api/v2/investigations')
+        assert isinstance(exc.value.__cause__, requests.exceptions.RequestException)
+
+
+def test_fanout_rate_limit(mock_workbench, monkeypatch):
+    limiters = []
+
+    class CountingLimiter(RateLimiter):
+        calls = 0
+
+        def __init__(self, rate):
+            super().__init__(rate)
+            limiters.append(self)
+
+        def wait(self):
+            self.calls += 1
+            super().wait()
+
+    monkeypatch.setattr(fanout, 'RateLimiter', CountingLimiter)
+    xc = mock_workbench.client()
+    org_ids = [org['id'] for org in mock_workbench.records('organizations')]
+    template = xc.expel_alerts.prepare(relationship('organization.id', param('org')))
+    # 30 alerts per org is 3 pages, at 10 requests/s each org takes at least 0.2s, orgs are limited independently.
+    start = time.monotonic()
+    fan = FanOut(template, workers=2, rate_limit=10)
+    assert len(list(fan.run(org_ids, client=xc))) == 60
+    assert time.monotonic() - start >= 0.2
+    assert [limiter.calls for limiter in limiters] == [3, 3]
+
+
+def test_fanout_records_use_client(mock_workbench):
+    xc = mock_workbench.client()
+    org_ids = [org['id'] for org in mock_workbench.records('organizations')]
+    names = {org['id']: org['attributes']['name'] for org in mock_workbench.records('organizations')}
+    template = xc.investigations.prepare(relationship('organization.id', param('org')))
+    fan = FanOut(template, rate_limit=100, deadline=0.2)
+    results = list(fan.run(org_ids, client=xc))
+    assert not fan.errors
+    # Records are handed the client, not the tenant's rate limited and deadline bound view of it
+    assert all(inv._conn is xc for _, inv in results)
+
+    # A lazy load after the tenants' deadline has passed
+    time.sleep(0.25)
+    requests = mock_workbench.stats['requests']
+    org_id, inv = results[0]
+    assert inv.organization.name == names[org_id]
+    assert mock_workbench.stats['requests'] == requests + 1
+
+
+def test_fanout_early_stop(mock_workbench):
+    xc = mock_workbench.client()
+    org_ids = [org['id'] for org in mock_workbench.records('organizations')]
+    fan = FanOut(xc.expel_alerts.prepare(relationship('organization.id', param('org'))), buffer=1)
+    gen = fan.run(org_ids, client=xc)
+    next(gen)
+    gen.close()
+
+
+def test_rate_limiter():
+    limiter = RateLimiter(50)
+    start = time.monotonic()
+    for _ in range(6):
+        limiter.wait()
+    assert time.monotonic() - start >= 0.1
+
+
+def test_fanout_template_params(mock_workbench):
+    xc = mock_workbench.client()
+    with pytest.raises(ValueError):
+        FanOut(xc.investigations.prepare(relationship('organization.id', param('org')), short_link=param('link')))
+    with pytest.raises(ValueError):
+        list(FanOut(xc.investigations.prepare()).run(['a']))
@@ -0,0 +1,59 @@
+import subprocess
+import sys
+
+import pyexclient.workbench as workbench
+
+
+def import_times(code):
+    '''
+    Run ``code`` in a fresh interpreter with ``-X importtime`` and return a dict of module name to
+    (self, cumulative) import time in microseconds.
+    '''
+    proc = subprocess.run([sys.executable, '-X', 'importtime', '-c', code],
+                          capture_output=True, text=True, check=True)
+    times = {}
+    for line in proc.stderr.splitlines():
+        if not line.startswith('import time:') or 'self [us]' in line:
+            continue
+        self_us, cumulative_us, name = line[len('import time:'):].split('|')
+        times[name.strip()] = (int(self_us), int(cumulative_us))
+    return times
+
+
+def test_import_does_not_load_resources():
+    times = import_times('import pyexclient')
+    assert 'pyexclient.workbench' in times
+    assert 'pyexclient.resources' not in times
+
+
+def test_import_loads_only_the_client():
+    code = ('import sys; import pyexclient; '
+            'print(",".join(sorted(name for name in sys.modules if name.split(".")[0] in ("pyexclient", "httpx"))))')
+    proc = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True, check=True)
+    loaded = set(proc.stdout.strip().split(','))
+    assert {'pyexclient', 'pyexclient.workbench'} <= loaded
+    # The resource classes, the optional HTTP/2 transport and the helpers built on the client load when first used
+    for name in ('pyexclient.resources', 'pyexclient.timeline', 'pyexclient.cache', 'pyexclient.fanout',
+                 'pyexclient.backfill', 'pyexclient.testing', 'httpx'):
+        assert name not in loaded
+
+
+def test_resources_load_on_access():
+    code = ('import sys; import pyexclient.workbench as wb; '
+            'assert "pyexclient.resources" not in sys.modules; '
+            'wb.Investigations; '
+            'assert "pyexclient.resources" in sys.modules')
+    subprocess.run([sys.executable, '-c', code], check=True)
+
+
+def test_module_getattr():
+    from pyexclient.resources import Investigations
+    assert workbench.Investigations is Investigations
+    assert workbench.RELATIONSHIP_TO_CLASS['investigations'] is Investigations
+
+    try:
+        workbench.not_a_resource
+    except AttributeError as e:
+        assert 'pyexclient.workbench' in str(e)
+    else:
+        assert False, 'expected AttributeError'
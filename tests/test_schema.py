@@ -0,0 +1,69 @@
+import pytest
+
+from pyexclient.schema import registry
+from pyexclient.schema import SchemaRegistry
+from pyexclient.workbench import Investigations
+from pyexclient.workbench import ResourceInstance
+from pyexclient.workbench import VendorAlertEvidences
+
+
+def test_registry_is_compiled_once():
+    assert registry() is registry()
+    assert 'investigations' in registry()
+    assert len(registry()) == len(list(registry()))
+
+
+def test_resource_schema():
+    schema = registry()['investigations']
+    assert schema.api_type == 'investigations'
+    assert isinstance(schema.attributes, frozenset)
+    assert 'close_comment' in schema.attributes
+    assert schema.attribute_types['is_incident'] == 'boolean'
+    assert schema.relationship_types['organization'] == 'organizations'
+    assert schema.is_field('organization') and schema.is_field('title')
+    assert not schema.is_field('nope')
+    assert {'created_at', 'updated_at', 'status_updated_at'} <= schema.timestamp_fields()
+    assert 'title' not in schema.timestamp_fields()
+
+
+def test_registry_is_frozen():
+    schema = registry()['investigations']
+    with pytest.raises(AttributeError):
+        schema.attributes = frozenset()
+    with pytest.raises(TypeError):
+        schema.attribute_types['title'] = 'number'
+    with pytest.raises(TypeError):
+        registry().field_to_type['organization'] = 'nope'
+
+
+def test_round_trip():
+    reg = SchemaRegistry.loads(registry().dumps())
+    assert set(reg) == set(registry())
+    assert reg['expel_alerts'] == registry()['expel_alerts']
+    assert dict(reg.field_to_type) == dict(registry().field_to_type)
+
+    with pytest.raises(ValueError):
+        SchemaRegistry.loads('{"version": 2, "types": {}}')
+
+
+def test_classes_bound_to_schema():
+    assert Investigations._schema is registry()['investigations']
+    assert Investigations._def_attributes is registry()['investigations'].attributes
+    assert Investigations._def_relationships is registry()['investigations'].relationships
+
+
+def test_unknown_type_keeps_lists():
+    class Widgets(ResourceInstance):
+        _api_type = 'widgets'
+        _def_attributes = ['size']
+        _def_relationships = ['investigation']
+
+    assert Widgets._def_attributes == frozenset(['size'])
+    assert Widgets._schema.api_type == 'widgets'
+
+
+def test_relationship_resolution_uses_schema():
+    ev = VendorAlertEvidences({'id': '1', 'attributes': {}}, None)
+    # The global lookup table can't tell which type a relationship name points at, the schema can.
+    assert ev._rel_to_class('evidenced_expel_alerts').__name__ == 'ExpelAlerts'
+    assert ev._rel_to_class('vendor_alert').__name__ == 'VendorAlerts'
@@ -0,0 +1,92 @@
+import io
+
+import pytest
+import requests
+
+from pyexclient.testing import MockWorkbench
+from pyexclient.workbench import ExpelAlerts
+from pyexclient.workbench import gt
+from pyexclient.workbench import include
+from pyexclient.workbench import isnull
+from pyexclient.workbench import limit
+from pyexclient.workbench import relationship
+from pyexclient.workbench import sort
+
+
+def test_pagination(mock_workbench):
+    xc = mock_workbench.client()
+    before = mock_workbench.stats['requests']
+    eas = list(xc.expel_alerts.search())
+    assert len(eas) == len(mock_workbench.records('expel_alerts')) == 60
+    assert all(isinstance(ea, ExpelAlerts) for ea in eas)
+    assert len({ea.id for ea in eas}) == 60
+    # 10 per page
+    assert mock_workbench.stats['requests'] - before == 6
+    assert [ea.created_at for ea in eas] == sorted(ea.created_at for ea in eas)
+
+
+def test_count_and_filters(mock_workbench):
+    xc = mock_workbench.client()
+    assert xc.investigations.count() == 20
+    assert xc.investigations.search(is_incident=True).count() == 4
+    assert xc.investigations.search(close_comment=isnull()).count() == 10
+    assert xc.investigations.search(short_link='ORG1-3').one_or_none().title == 'Investigation 1-3'
+
+    inv = xc.investigations.search(short_link='ORG0-1').one_or_none()
+    eas = list(xc.expel_alerts.search(relationship('investigation.id', inv.id)))
+    assert len(eas) == 3
+    assert {ea.relationship.investigation.id for ea in eas} == {inv.id}
+
+    last = max(ea.created_at for ea in eas)
+    assert xc.expel_alerts.search(relationship('investigation.id', inv.id), created_at=gt(last)).count() == 0
+
+
+def test_sort_limit_include(mock_workbench):
+    xc = mock_workbench.client()
+    first = xc.investigations.search(sort('created_at', 'desc'), limit(1)).one_or_none()
+    assert first.short_link == 'ORG1-9'
+
+    res = xc.expel_alerts.search(include('investigation'), limit(6))
+    assert {inc._type for inc in res.content['included']} == {'investigations'}
+    assert len(res.content['included']) == 2
+
+
+def test_lazy_load_and_save():
+    with MockWorkbench(organizations=1, investigations=2) as wb:
+        xc = wb.client()
+        ea = xc.expel_alerts.search().one_or_none()
+        assert ea.investigation.title == 'Investigation 0-0'
+        assert len(ea.vendor_alerts) == 2
+
+        inv = ea.investigation
+        inv.title = 'changed'
+        inv.save()
+        assert xc.investigations.get(id=inv.id).title == 'changed'
+
+
+def test_download(mock_workbench):
+    xc = mock_workbench.client()
+    ia = xc.investigative_actions.search().one_or_none()
+    fd = io.BytesIO()
+    assert ia.download(fd) == mock_workbench.download_size
+    assert len(fd.getvalue()) == mock_workbench.download_size
+
+
+def test_throttle_retried():
+    with MockWorkbench(organizations=1, investigations=5, page_size=2, throttle_every=3) as wb:
+        xc = wb.client()
+        assert len(list(xc.investigations.search())) == 5
+        assert wb.stats['throttled'] > 0
+
+
+def test_connection_reuse(mock_workbench):
+    xc = mock_workbench.client()
+    before = dict(mock_workbench.stats)
+    list(xc.expel_alerts.search())
+    assert mock_workbench.stats['connections'] - before['connections'] == 1
+
+
+def test_not_found(mock_workbench):
+    xc = mock_workbench.client()
+    with pytest.raises(requests.exceptions.HTTPError):
+        xc.investigations.get(id='nope')
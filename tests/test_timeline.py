@@ -0,0 +1,70 @@
+import pytest
+
+from pyexclient import testing
+from pyexclient.testing import MockWorkbench
+from pyexclient.testing import _timestamp
+from pyexclient.timeline import TIMELINE_SOURCES
+
+
+def _investigation_records(wb, inv_id):
+    return {rec['id'] for api_type, _, _ in TIMELINE_SOURCES for rec in wb.records(api_type)
+            if rec['relationships'].get('investigation') == ('investigations', inv_id)}
+
+
+def test_timeline_complete_and_ordered(mock_workbench):
+    xc = mock_workbench.client()
+    inv = mock_workbench.records('investigations')[3]
+    events = list(xc.timeline(inv['id']))
+    assert {record.id for _, record in events} == _investigation_records(mock_workbench, inv['id'])
+    times = [when for when, _ in events]
+    assert times == sorted(times)
+    assert {record._api_type for _, record in events} == {
+        'expel_alerts', 'expel_alert_histories', 'investigative_actions', 'investigation_histories'}
+
+
+def test_investigation_timeline(mock_workbench):
+    xc = mock_workbench.client()
+    inv = xc.investigations.search(short_link='ORG1-2').one_or_none()
+    assert [record.id for _, record in inv.timeline()] == [record.id for _, record in xc.timeline(inv.id)]
+
+
+@pytest.mark.parametrize('nulls_first', [False, True])
+def test_timeline_merges_sources(monkeypatch, nulls_first):
+    if nulls_first:
+        # A server that sorts nulls first on an ascending sort
+        monkeypatch.setattr(testing, '_sort_key', lambda value: (value is not None, value if value is not None else ''))
+    with MockWorkbench(organizations=1, investigations=1) as wb:
+        inv = wb.records('investigations')[0]
+        inv_ref = {'investigation': ('investigations', inv['id'])}
+        wb.store.add('timeline_entries', 'te-1', {'event_date': _timestamp(-10), 'created_at': _timestamp(50)}, inv_ref)
+        wb.store.add('timeline_entries', 'te-2', {'event_date': None, 'created_at': _timestamp(51)}, inv_ref)
+        wb.store.add('comments', 'c-1', {'comment': 'looks bad', 'created_at': _timestamp(10)}, inv_ref)
+
+        xc = wb.client()
+        events = list(xc.timeline(inv['id']))
+        # One page of every source, fetched at once
+        assert wb.stats['requests'] == len(TIMELINE_SOURCES)
+
+    ids = [record.id for _, record in events]
+    # Entries are placed by their event date, those without one come last
+    assert ids[0] == 'te-1' and ids[-1] == 'te-2'
+    assert events[-1][0] is None
+    comment = ids.index('c-1')
+    assert events[comment - 1][0] < events[comment][0] < events[comment + 1][0]
+
+
+def test_timeline_source_failure():
+    with MockWorkbench(organizations=1, investigations=1) as wb:
+        xc = wb.client()
+        inv = wb.records('investigations')[0]
+        with pytest.raises(AttributeError):
+            list(xc.timeline(inv['id'], sources=TIMELINE_SOURCES + (('no_such_type', 'created_at', ()),)))
+
+
+def test_timeline_sources_concurrent():
+    with MockWorkbench(organizations=1, investigations=1, latency=0.2) as wb:
+        xc = wb.client()
+        inv = wb.records('investigations')[0]
+        assert list(xc.timeline(inv['id']))
+        # Every source is requested at once, not one after another
+        assert wb.stats['peak_in_flight'] == len(TIMELINE_SOURCES)
@@ -0,0 +1,141 @@
+import concurrent.futures
+import gzip
+import io
+import json
+
+import pytest
+import requests
+
+from pyexclient.testing import MockWorkbench
+from pyexclient.transport import PooledHTTPAdapter
+from pyexclient.transport import TransportConfig
+
+
+def test_adapter_config(mock_workbench):
+    xc = mock_workbench.client(transport=TransportConfig(pool_connections=2, pool_maxsize=4, pool_block=True))
+    adapter = xc.session.get_adapter(mock_workbench.base_url)
+    assert isinstance(adapter, PooledHTTPAdapter)
+    assert adapter is xc.session.get_adapter('https://workbench.expel.io')
+    assert (adapter._pool_connections, adapter._pool_maxsize, adapter._pool_block) == (2, 4, True)
+    assert adapter.max_retries.status == 3
+
+
+def test_connection_reuse(mock_workbench):
+    xc = mock_workbench.client()
+    for _ in range(10):
+        xc.investigations.count()
+    assert xc.transport_stats() == {'requests': 10, 'connections': 1, 'reuse': 0.9}
+
+    xc = mock_workbench.client(transport=TransportConfig(keep_alive=False))
+    before = mock_workbench.stats['connections']
+    for _ in range(5):
+        xc.investigations.count()
+    assert xc.transport_stats() == {'requests': 5, 'connections': 5, 'reuse': 0.0}
+    assert mock_workbench.stats['connections'] - before == 5
+
+
+def test_pool_block_limits_connections():
+    with MockWorkbench(organizations=1, investigations=1, latency=0.02) as wb:
+        xc = wb.client(transport=TransportConfig(pool_maxsize=2, pool_block=True))
+        with concurrent.futures.ThreadPoolExecutor(8) as pool:
+            assert list(pool.map(lambda _: xc.investigations.count(), range(16))) == [1] * 16
+        stats = xc.transport_stats()
+        assert stats['requests'] == 16
+        assert stats['connections'] <= 2
+
+
+def test_upload_uses_session(mock_workbench):
+    xc = mock_workbench.client()
+    resp = xc.request('post', '/api/v2/files/abc/upload', files={'file': io.BytesIO(b'data')})
+    assert resp.json() == {'data': None}
+    assert xc.transport_stats()['requests'] == 1
+
+
+def test_http2_transport():
+    pytest.importorskip('httpx')
+    pytest.importorskip('h2')
+    with MockWorkbench(organizations=1, investigations=5, throttle_every=4, page_size=5, download_size=10000) as wb:
+        xc = wb.client(transport=TransportConfig(http2=True))
+        assert len(list(xc.expel_alerts.search())) == 15
+
+        ia = xc.investigative_actions.search().one_or_none()
+        fd = io.BytesIO()
+        assert ia.download(fd) == 10000
+        assert wb.stats['throttled'] == 1
+
+        stats = xc.transport_stats()
+        assert stats['connections'] == wb.stats['connections'] == 1
+        assert stats['reuse'] > 0.5
+
+
+def test_http2_counts_connects():
+    pytest.importorskip('httpx')
+    pytest.importorskip('h2')
+    with MockWorkbench(organizations=1, investigations=2) as wb:
+        xc = wb.client(transport=TransportConfig(http2=True, keep_alive=False))
+        before = wb.stats['connections']
+        for _ in range(5):
+            xc.investigations.count()
+        # Every request opens a connection of its own
+        assert xc.transport_stats()['connections'] == wb.stats['connections'] - before == 5
+        xc.close()
+
+
+def test_http2_session_settings():
+    pytest.importorskip('httpx')
+    pytest.importorskip('h2')
+    with MockWorkbench(organizations=1, investigations=2) as wb:
+        xc = wb.client(transport=TransportConfig(http2=True))
+        adapter = xc.session.get_adapter(wb.base_url)
+        # Keep a CA bundle set in the environment from overriding verify
+        xc.session.trust_env = False
+        xc.session.verify = False
+        assert xc.investigations.count() == 2
+        assert (False, None, None) in adapter._clients
+
+        # Requests go through the session's proxy, here one that isn't listening
+        xc.session.proxies = {'http': 'http://127.0.0.1:9'}
+        with pytest.raises(requests.exceptions.ConnectionError):
+            xc.investigations.count()
+        assert (False, None, 'http://127.0.0.1:9') in adapter._clients
+        xc.close()
+
+
+def test_accept_encoding(mock_workbench):
+    assert mock_workbench.client().session.headers['Accept-Encoding'] == TransportConfig().accept_encoding
+    assert 'gzip' in TransportConfig().accept_encoding
+    xc = mock_workbench.client(transport=TransportConfig(accept_encoding='identity'))
+    assert xc.session.headers['Accept-Encoding'] == 'identity'
+
+
+def test_encode_body():
+    config = TransportConfig(compress_min_size=100)
+    body = json.dumps({'data': {'attributes': {'comment': 'x' * 200}}})
+    data, encoding = config.encode_body('patch', body)
+    assert encoding == 'gzip'
+    assert gzip.decompress(data).decode() == body
+    assert config.encode_body('get', body) == (body, None)
+    assert config.encode_body('post', '{}') == ('{}', None)
+    assert TransportConfig().encode_body('post', body) == (body, None)
+
+
+def test_compression_stats():
+    with MockWorkbench(organizations=1, investigations=5) as wb:
+        xc = wb.client(transport=TransportConfig(compress_min_size=64))
+        assert len(list(xc.expel_alerts.search())) == 15
+        stats = xc.compression_stats()
+        assert stats['requests'] == 1
+        assert stats['received_wire'] < stats['received']
+        assert stats['received_ratio'] < 0.5
+
+        inv = xc.investigations.search().one_or_none()
+        inv.close_comment = 'closing ' * 50
+        inv.save()
+        assert xc.investigations.get(id=inv.id).close_comment == 'closing ' * 50
+        stats = xc.compression_stats()
+        assert stats['sent_wire'] < stats['sent']
+
+        xc = wb.client(transport=TransportConfig(accept_encoding='identity'))
+        list(xc.expel_alerts.search())
+        stats = xc.compression_stats()
+        assert stats['received_wire'] == stats['received']
@@ -1,5 +1,10 @@
+import concurrent.futures
 import copy
 import datetime
+import hashlib
+import io
+import json
+import pickle
 import uuid
 from unittest.mock import MagicMock
 from unittest.mock import Mock
@@ -7,8 +12,15 @@ from unittest.mock import patch
 from urllib.parse import unquote
 
 import pytest
+import requests
 
+from pyexclient.testing import MockWorkbench
+from pyexclient.transport import TransportConfig
+from pyexclient.workbench import _AttributeField
+from pyexclient.workbench import _RelationshipField
 from pyexclient.workbench import contains
+from pyexclient.workbench import fields
+from pyexclient.workbench import Files
 from pyexclient.workbench import flag
 from pyexclient.workbench import gt
 from pyexclient.workbench import include
@@ -19,7 +31,11 @@ from pyexclient.workbench import limit
 from pyexclient.workbench import lt
 from pyexclient.workbench import neq
 from pyexclient.workbench import notnull
+from pyexclient.workbench import param
+from pyexclient.workbench import parse_timestamp
+from pyexclient.workbench import parse_timestamps
 from pyexclient.workbench import relationship
+from pyexclient.workbench import ResourceInstance
 from pyexclient.workbench import sort
 from pyexclient.workbench import startswith
 from pyexclient.workbench import window
@@ -604,3 +620,559 @@ def test_delete_prompt_answer(answer, exc_msg, prompt_on_delete):
             assert x.session.request.call_args[1]['url'] == '/api/v2/investigations/%s' % guid
             # Assert we used the right method :)
             assert x.session.request.call_args[1]['method'] == 'delete'
+
+
+class FakeDownloadResponse:
+    def __init__(self, body, status_code=200, headers=None, fail_after=None):
+        self.body = body
+        self.status_code = status_code
+        self.headers = headers or {}
+        self.fail_after = fail_after
+        self.closed = False
+
+    def iter_content(self, chunk_size=1):
+        sent = 0
+        for i in range(0, len(self.body), chunk_size):
+            if self.fail_after is not None and sent >= self.fail_after:
+                raise requests.exceptions.ChunkedEncodingError('connection reset')
+            chunk = self.body[i:i + chunk_size]
+            sent += len(chunk)
+            yield chunk
+
+    def close(self):
+        self.closed = True
+
+
+class FakeDownloadConn:
+    '''
+    Serves a blob from the download route, honoring Range headers. The first ``failures`` responses are cut off
+    half way through.
+    '''
+
+    def __init__(self, blob, failures=0, ranges=True):
+        self.blob = blob
+        self.failures = failures
+        self.ranges = ranges
+        self.calls = []
+
+    def request(self, method, url, headers=None, stream=False):
+        rng = (headers or {}).get('Range')
+        self.calls.append(rng)
+        body, status, resp_headers = self.blob, 200, {'Content-Length': str(len(self.blob))}
+        if rng and self.ranges:
+            start, end = rng[len('bytes='):].split('-')
+            end = int(end) if end else len(self.blob) - 1
+            body = self.blob[int(start):end + 1]
+            status = 206
+            resp_headers = {'Content-Length': str(len(body)),
+                            'Content-Range': 'bytes %s-%d/%d' % (start, end, len(self.blob))}
+        fail_after = None
+        if self.failures:
+            self.failures -= 1
+            fail_after = len(body) // 2
+        return FakeDownloadResponse(body, status, resp_headers, fail_after)
+
+
+class TestFilesDownload:
+    blob = bytes(range(256)) * 1000
+
+    def make_file(self, conn):
+        return Files({'id': 'f1', 'attributes': {}}, conn)
+
+    def test_download(self):
+        conn = FakeDownloadConn(self.blob)
+        fd = io.BytesIO()
+        assert self.make_file(conn).download(fd, chunk_size=4096) == len(self.blob)
+        assert fd.getvalue() == self.blob
+        assert conn.calls == [None]
+
+    def test_resume(self):
+        conn = FakeDownloadConn(self.blob, failures=2)
+        fd = io.BytesIO()
+        self.make_file(conn).download(fd, chunk_size=4096)
+        assert fd.getvalue() == self.blob
+        assert conn.calls[0] is None
+        assert all(call.startswith('bytes=') for call in conn.calls[1:])
+
+    def test_resume_range_ignored(self):
+        conn = FakeDownloadConn(self.blob, failures=1, ranges=False)
+        fd = io.BytesIO()
+        self.make_file(conn).download(fd, chunk_size=4096)
+        assert fd.getvalue() == self.blob
+
+    def test_resume_gives_up(self):
+        conn = FakeDownloadConn(self.blob, failures=5)
+        with pytest.raises(requests.exceptions.ChunkedEncodingError):
+            self.make_file(conn).download(io.BytesIO(), chunk_size=4096, retries=2)
+
+    def test_parallel(self, tmp_path):
+        conn = FakeDownloadConn(self.blob, failures=1)
+        with open(tmp_path / 'out', 'w+b') as fd:
+            fd.write(b'header')
+            written = self.make_file(conn).download(fd, chunk_size=4096, workers=4)
+            assert fd.tell() == len(b'header') + len(self.blob)
+        assert written == len(self.blob)
+        assert (tmp_path / 'out').read_bytes() == b'header' + self.blob
+
+    def test_parallel_without_file(self):
+        conn = FakeDownloadConn(self.blob)
+        fd = io.BytesIO()
+        self.make_file(conn).download(fd, workers=4)
+        assert fd.getvalue() == self.blob
+        assert conn.calls == [None]
+
+    def test_length_mismatch(self):
+        conn = FakeDownloadConn(self.blob)
+        conn.blob = self.blob[:-10]
+        conn.request = Mock(return_value=FakeDownloadResponse(
+            self.blob[:-10], headers={'Content-Length': str(len(self.blob))}))
+        with pytest.raises(Exception) as e:
+            self.make_file(conn).download(io.BytesIO())
+        assert 'incomplete' in str(e.value)
+
+
+class TestDownloadAll:
+    def make_ia(self, guid, task_id):
+        return {'type': 'investigative_actions', 'id': guid, 'attributes': {'result_task_id': task_id}}
+
+    def route(self, method, url, headers=None, stream=False):
+        resp = Mock()
+        if url.startswith('/api/v2/investigative_actions'):
+            resp.json.return_value = {'data': [self.make_ia('ia1', 't1'), self.make_ia('ia2', 't2'),
+                                               self.make_ia('ia3', 't3'), self.make_ia('ia4', None)]}
+            return resp
+        task_id = url.split('/')[4]
+        self.downloads.append(task_id)
+        if task_id == 't3':
+            raise requests.exceptions.HTTPError('boom')
+        return FakeDownloadResponse(b'same results' if task_id in ('t1', 't2') else b'other')
+
+    def test_download_all(self, mock_client, tmp_path):
+        self.downloads = []
+        mock_client.request.side_effect = self.route
+
+        manifest = mock_client.investigative_actions.search().download_all(str(tmp_path), workers=3)
+        by_id = {entry['id']: entry for entry in manifest}
+        assert [entry['id'] for entry in manifest] == ['ia1', 'ia2', 'ia3', 'ia4']
+        assert by_id['ia1']['path'] == by_id['ia2']['path']
+        assert by_id['ia1']['size'] == len(b'same results')
+        assert (tmp_path / by_id['ia1']['path']).read_bytes() == b'same results'
+        assert by_id['ia3']['error'] == 'boom'
+        assert by_id['ia4']['error'] == 'no results to download'
+        assert sorted(self.downloads) == ['t1', 't2', 't3']
+        assert sorted(p.name for p in tmp_path.iterdir()) == sorted([by_id['ia1']['path'], 'manifest.json'])
+
+        # Second run only retries what failed
+        self.downloads = []
+        manifest = mock_client.investigative_actions.search().download_all(str(tmp_path), workers=3)
+        assert sorted(self.downloads) == ['t3']
+        assert [entry['skipped'] for entry in manifest] == [True, True, False, False]
+
+    def test_download_all_interrupted(self, mock_client, tmp_path):
+        self.downloads = []
+
+        def interrupted(method, url, headers=None, stream=False):
+            if '/t3/' in url:
+                raise KeyboardInterrupt()
+            return self.route(method, url, headers=headers, stream=stream)
+
+        mock_client.request.side_effect = interrupted
+        with pytest.raises(KeyboardInterrupt):
+            mock_client.investigative_actions.search().download_all(str(tmp_path), workers=1)
+        # Downloads finished before the interruption are in the manifest
+        with open(tmp_path / 'manifest.json') as fd:
+            saved = {entry['id']: entry for entry in json.load(fd)}
+        assert sorted(saved) == ['ia1', 'ia2', 'ia4']
+        assert saved['ia1']['path'] and saved['ia4']['error'] == 'no results to download'
+
+        self.downloads = []
+        mock_client.request.side_effect = self.route
+        manifest = mock_client.investigative_actions.search().download_all(str(tmp_path), workers=1)
+        assert sorted(self.downloads) == ['t3']
+        assert [entry['skipped'] for entry in manifest] == [True, True, False, False]
+
+    def test_download_all_parallel_ranges(self, mock_client, tmp_path):
+        blob = bytes(range(256)) * 1000
+        conn = FakeDownloadConn(blob)
+
+        def route(method, url, headers=None, stream=False):
+            if url.startswith('/api/v2/investigative_actions'):
+                resp = Mock()
+                resp.json.return_value = {'data': [self.make_ia('ia1', 't1')]}
+                return resp
+            return conn.request(method, url, headers=headers, stream=stream)
+
+        mock_client.request.side_effect = route
+        search = mock_client.investigative_actions.search()
+        entry, = search.download_all(str(tmp_path), download_workers=4, chunk_size=4096)
+        # The byte ranges are fetched in parallel rather than falling back to a single stream
+        assert len([call for call in conn.calls if call and call != 'bytes=0-0']) == 4
+        assert entry['size'] == len(blob) and entry['sha256'] == hashlib.sha256(blob).hexdigest()
+        assert (tmp_path / entry['path']).read_bytes() == blob
+
+    def test_download_all_wrong_type(self, mock_client):
+        with pytest.raises(Exception):
+            mock_client.investigations.search().download_all('/tmp')
+
+
+class TestPreparedSearch:
+    def test_matches_search(self, mock_client):
+        dt = datetime.datetime(2020, 1, 1)
+        mock_client.security_devices.search(status_updated_at=gt(dt), status=neq('healthy'), raw_status=flag('true'))
+        expected = mock_client.request.call_args[0][1]
+
+        prepared = mock_client.security_devices.prepare(
+            status_updated_at=gt(param('since')), status=neq('healthy'), raw_status=flag('true'))
+        assert prepared.params == frozenset(['since'])
+        assert prepared.url(since=dt) == expected
+
+        prepared.search(since=dt)
+        assert mock_client.request.call_args[0][1] == expected
+
+    def test_rebinds(self, mock_client):
+        prepared = mock_client.investigations.prepare(
+            relationship('organization.id', param('org')), limit(param('n')), created_at=window(param('start'), param('end')))
+        url = unquote(prepared.url(org='o&1', start='2020-01-01', end='2020-02-01', n=5))
+        assert url == '/api/v2/investigations?filter[organization][id]=o&1&page[limit]=5&filter[created_at]=>2020-01-01&filter[created_at]=<2020-02-01&sort=+created_at&sort=+id'
+        url = unquote(prepared.url(org='o2', start='2021-01-01', end='2021-02-01', n=10))
+        assert url == '/api/v2/investigations?filter[organization][id]=o2&page[limit]=10&filter[created_at]=>2021-01-01&filter[created_at]=<2021-02-01&sort=+created_at&sort=+id'
+        # Values are escaped on the way in
+        assert 'o%261' in prepared.url(org='o&1', start='', end='', n=5)
+
+    def test_bad_params(self, mock_client):
+        prepared = mock_client.investigations.prepare(title=param('title'))
+        with pytest.raises(ValueError):
+            prepared.url()
+        with pytest.raises(ValueError):
+            prepared.url(title='a', other='b')
+        with pytest.raises(ValueError):
+            param('not an identifier')
+
+    def test_using(self, mock_client, raw_investigation_dict):
+        other = Mock()
+        other.request.return_value.json.return_value = {'data': [raw_investigation_dict]}
+        prepared = mock_client.investigations.prepare(title=param('title')).using(other)
+        assert [inv.id for inv in prepared.search(title='x')] == [raw_investigation_dict['id']]
+        assert not mock_client.request.called
+
+
+def _child_titles(pickled_records):
+    records = pickle.loads(pickled_records)
+    return [(inv.title, inv.organization.name) for inv in records]
+
+
+class TestPickle:
+    def test_client_round_trip(self, mock_workbench):
+        xc = mock_workbench.client(transport=TransportConfig(pool_maxsize=4))
+        xc.investigations.count()
+        xc.password = 'secret'
+        xc.mfa_code = 123456
+
+        clone = pickle.loads(pickle.dumps(xc))
+        assert clone.session is None
+        assert clone.token == xc.token
+        assert clone.password is None and clone.mfa_code is None
+        assert clone.transport.pool_maxsize == 4
+        # The session is rebuilt on first use, without logging in
+        assert clone.investigations.count() == 20
+        assert clone.session.headers['Authorization'] == xc.token
+
+    def test_resource_instances(self, mock_workbench):
+        xc = mock_workbench.client()
+        invs = list(xc.investigations.search(limit(3)))
+        # Loaded relationships are not shipped
+        assert invs[0].organization.name
+        invs[1].title = 'changed'
+
+        blob = pickle.dumps(invs)
+        assert len(blob) < sum(len(json.dumps(inv._data)) for inv in invs) + 2000
+        clones = pickle.loads(blob)
+        assert [type(c) for c in clones] == [type(i) for i in invs]
+        assert [c.id for c in clones] == [i.id for i in invs]
+        assert clones[0]._relobjs == {}
+        assert clones[1].title == 'changed' and clones[1]._modified_fields == {'title'}
+        # All records share one client
+        assert len({id(c._conn) for c in clones}) == 1
+
+    def test_process_pool(self, mock_workbench):
+        xc = mock_workbench.client()
+        invs = list(xc.investigations.search(limit(4)))
+        expected = [(inv.title, inv.organization.name) for inv in invs]
+        with concurrent.futures.ProcessPoolExecutor(2) as pool:
+            assert pool.submit(_child_titles, pickle.dumps(invs)).result() == expected
+
+
+class TestGroupCount:
+    def test_group_count(self, mock_workbench):
+        xc = mock_workbench.client()
+        alerts = mock_workbench.records('expel_alerts')
+        orgs = sorted(org['id'] for org in mock_workbench.records('organizations'))
+        severities = sorted({ea['attributes']['expel_severity'] for ea in alerts})
+
+        rows = xc.expel_alerts.group_count({'expel_severity': severities, 'organization.id': orgs})
+        assert [(row['expel_severity'], row['organization.id']) for row in rows] == [(s, o) for s in severities for o in orgs]
+        for row in rows:
+            key = (row['expel_severity'], row['organization.id'])
+            assert row['count'] == sum(1 for ea in alerts if (ea['attributes']['expel_severity'], ea['relationships']['organization'][1]) == key)
+        assert sum(row['count'] for row in rows) == 60
+
+    def test_cache(self, mock_workbench):
+        xc = mock_workbench.client()
+        cache = {}
+        before = mock_workbench.stats['requests']
+        rows = xc.investigations.group_count({'is_incident': [True, False, True]}, cache=cache)
+        assert [row['count'] for row in rows] == [4, 16, 4]
+        assert mock_workbench.stats['requests'] - before == 2
+
+        rows = xc.investigations.group_count({'is_incident': [False]}, cache=cache)
+        assert rows == [{'is_incident': False, 'count': 16}]
+        assert mock_workbench.stats['requests'] - before == 2
+
+    def test_histogram(self, mock_workbench):
+        xc = mock_workbench.client()
+        created = [datetime.datetime.strptime(ea['attributes']['created_at'], '%Y-%m-%dT%H:%M:%S.%fZ')
+                   for ea in mock_workbench.records('expel_alerts')]
+        start = datetime.datetime(2020, 1, 1)
+        end = start + datetime.timedelta(hours=3, minutes=10)
+
+        rows = xc.expel_alerts.histogram('created_at', start, end, bucket='30m')
+        assert len(rows) == 7
+        assert rows[-1]['created_at'] == start + datetime.timedelta(hours=3)
+        for row in rows:
+            bucket_end = min(row['created_at'] + datetime.timedelta(minutes=30), end)
+            assert row['count'] == sum(1 for c in created if row['created_at'] <= c < bucket_end)
+
+        rows = xc.expel_alerts.histogram('created_at', start, end, bucket=datetime.timedelta(hours=1),
+                                         groups={'status': ['OPEN', 'CLOSED']})
+        assert [(row['created_at'].hour, row['status']) for row in rows][:3] == [(0, 'OPEN'), (0, 'CLOSED'), (1, 'OPEN')]
+
+    @pytest.mark.parametrize('bucket', ['1x', 'd', '0h', datetime.timedelta(0)])
+    def test_bad_bucket(self, bucket):
+        bro = WorkbenchClient('https://workbench.expel.io', token='t').expel_alerts
+        with pytest.raises(ValueError):
+            bro.histogram('created_at', datetime.datetime(2020, 1, 1), datetime.datetime(2020, 1, 2), bucket=bucket)
+
+    def test_field_in_groups(self):
+        bro = WorkbenchClient('https://workbench.expel.io', token='t').expel_alerts
+        with pytest.raises(ValueError):
+            bro.histogram('created_at', datetime.datetime(2020, 1, 1), datetime.datetime(2020, 1, 2),
+                          groups={'created_at': [gt('2020-01-01')]})
+
+
+class TestChildrenOf:
+    def test_children_of(self, mock_workbench):
+        xc = mock_workbench.client()
+        invs = list(xc.investigations.search())
+        before = mock_workbench.stats['requests']
+        children = xc.expel_alerts.children_of(invs, 'investigation', workers=8)
+        # A single page search per parent
+        assert mock_workbench.stats['requests'] - before == 20
+        assert list(children) == [inv.id for inv in invs]
+        for inv in invs:
+            expected = list(xc.expel_alerts.search(relationship('investigation.id', inv.id)))
+            assert [ea.id for ea in children[inv.id]] == [ea.id for ea in expected]
+
+    def test_children_of_filters_and_ids(self, mock_workbench):
+        xc = mock_workbench.client()
+        inv_ids = [inv.id for inv in xc.investigations.search(limit(3))]
+        children = xc.expel_alerts.children_of(inv_ids + inv_ids[:1] + ['missing'], 'investigation', status='OPEN')
+        assert list(children) == inv_ids + ['missing']
+        assert children['missing'] == []
+        assert all(ea.status == 'OPEN' for eas in children.values() for ea in eas)
+        assert xc.expel_alerts.children_of([], 'investigation') == {}
+
+    def test_bad_relationship(self, mock_workbench):
+        with pytest.raises(ValueError):
+            mock_workbench.client().expel_alerts.children_of(['x'], 'nope')
+
+
+class TestFieldsOperator:
+    def test_value(self, mock_client):
+        mock_client.expel_alerts.search(fields('expel_name', 'expel_severity'))
+        result = get_url_from_request_mock(mock_client)
+        assert result == '/api/v2/expel_alerts?fields[expel_alerts]=expel_name,expel_severity&sort=+created_at&sort=+id'
+
+        mock_client.expel_alerts.search(include('investigation'), fields('title', api_type='investigations'))
+        result = get_url_from_request_mock(mock_client)
+        assert 'fields[investigations]=title' in result
+
+    def test_except(self, mock_client):
+        with pytest.raises(ValueError):
+            fields()
+        with pytest.raises(ValueError):
+            mock_client.expel_alerts.search(fields('expel_name', 'nope'))
+        with pytest.raises(ValueError):
+            mock_client.expel_alerts.search(fields('title', api_type='nope'))
+
+    def test_partial_records(self, mock_workbench):
+        xc = mock_workbench.client()
+        full = list(xc.investigations.search())
+        received = xc.compression_stats()['received']
+        invs = list(xc.investigations.search(fields('title', 'organization')))
+        assert xc.compression_stats()['received'] - received < received / 2
+
+        assert [inv.title for inv in invs] == [inv.title for inv in full]
+        assert invs[0].organization.id == full[0].organization.id
+        with pytest.raises(ValueError, match='fields'):
+            invs[0].close_comment
+        with pytest.raises(ValueError, match='fields'):
+            invs[0].created_by
+
+    def test_save_partial_record(self):
+        with MockWorkbench(organizations=1, investigations=1) as wb:
+            xc = wb.client()
+            inv = xc.investigations.search(fields('title')).one_or_none()
+            inv.close_comment = 'closed'
+            inv.save()
+            full = xc.investigations.get(id=inv.id)
+            assert full.close_comment == 'closed'
+            assert full.title == inv.title
+
+
+class TestRelIds:
+    def test_rel_id_without_fetch(self, mock_workbench):
+        xc = mock_workbench.client()
+        eas = list(xc.expel_alerts.search())[:5]
+        before = mock_workbench.stats['requests']
+        ids = [ea.rel_id('investigation') for ea in eas]
+        assert mock_workbench.stats['requests'] == before
+        assert ids == [ea.investigation.id for ea in eas]
+        # The proxies answer their id without fetching either
+        assert mock_workbench.stats['requests'] == before
+
+    def test_rel_id_fallback(self, mock_workbench):
+        xc = mock_workbench.client()
+        inv = xc.investigations.search().one_or_none()
+        before = mock_workbench.stats['requests']
+        ids = inv.rel_ids('expel_alerts')
+        # To-many relationships carry no linkage, they are loaded once
+        assert mock_workbench.stats['requests'] - before == 1
+        assert ids == [ea.id for ea in inv.expel_alerts]
+        assert mock_workbench.stats['requests'] - before == 1
+        assert inv.rel_ids('expel_alerts') == ids
+        with pytest.raises(ValueError):
+            inv.rel_id('expel_alerts')
+        with pytest.raises(ValueError):
+            inv.rel_id('nope')
+
+    def test_rel_id_modified(self, mock_workbench):
+        ea = mock_workbench.client().expel_alerts.search().one_or_none()
+        ea.relationship.investigation = 'abc'
+        assert ea.rel_id('investigation') == 'abc'
+        assert ea.rel_ids('investigation') == ['abc']
+
+
+class TestRelatedProxies:
+    def test_proxy_fetched_on_read(self, mock_workbench):
+        xc = mock_workbench.client()
+        ea = xc.expel_alerts.search().one_or_none()
+        before = mock_workbench.stats['requests']
+        inv = ea.investigation
+        assert isinstance(inv, Investigations)
+        assert ea.investigation is inv
+        assert inv.id == ea.rel_id('investigation')
+        assert mock_workbench.stats['requests'] == before
+        assert inv.title == xc.investigations.get(id=inv.id).title
+        assert mock_workbench.stats['requests'] - before == 2
+        assert inv.organization.id == inv.rel_id('organization')
+
+    def test_fill(self, mock_workbench):
+        xc = mock_workbench.client()
+        eas = list(xc.expel_alerts.search())
+        before = mock_workbench.stats['requests']
+        # 60 alerts of 20 investigations, each investigation is fetched once
+        assert xc.investigations.fill(ea.investigation for ea in eas) == 60
+        assert mock_workbench.stats['requests'] - before == 20
+        assert all(ea.investigation.title.startswith('Investigation') for ea in eas)
+        assert mock_workbench.stats['requests'] - before == 20
+        assert xc.investigations.fill(ea.investigation for ea in eas) == 0
+
+    def test_set_before_fetch(self):
+        with MockWorkbench(organizations=1, investigations=1) as wb:
+            xc = wb.client()
+            inv = xc.expel_alerts.search().one_or_none().investigation
+            inv.close_comment = 'closed'
+            assert inv.title == 'Investigation 0-0'
+            assert inv.close_comment == 'closed'
+            inv.save()
+            assert xc.investigations.get(id=inv.id).close_comment == 'closed'
+
+    def test_pickle_proxy(self, mock_workbench):
+        inv = mock_workbench.client().expel_alerts.search().one_or_none().investigation
+        inv = pickle.loads(pickle.dumps(inv))
+        assert inv.title.startswith('Investigation')
+
+    def test_pickle_after_fill(self, mock_workbench):
+        inv = mock_workbench.client().expel_alerts.search().one_or_none().investigation
+        assert inv.title.startswith('Investigation')
+        inv.close_comment = 'reopened'
+        clone = pickle.loads(pickle.dumps(inv))
+        assert clone.close_comment == 'reopened'
+        assert clone._modified_fields == {'close_comment'}
+
+    def test_proxy_class_from_linkage(self, mock_workbench):
+        ea = mock_workbench.client().expel_alerts.search().one_or_none()
+        ea._data['relationships']['assigned_to_actor'] = {'data': {'type': 'user_accounts', 'id': 'u-1'}}
+        actor = ea.assigned_to_actor
+        assert type(actor).__name__ == 'UserAccounts'
+        assert actor.id == 'u-1'
+
+
+class TestFieldDescriptors:
+    def test_descriptors(self, mock_workbench):
+        xc = mock_workbench.client()
+        ea = xc.expel_alerts.search().one_or_none()
+        assert isinstance(type(ea).__dict__['expel_name'], _AttributeField)
+        assert isinstance(type(ea).__dict__['investigation'], _RelationshipField)
+        # Members of the class are left alone
+        assert type(ea).id is ResourceInstance.id
+        assert ea.expel_name == ea._attrs['expel_name']
+        assert ea.investigation is ea.investigation
+
+        ea.expel_name = 'renamed'
+        assert ea.expel_name == 'renamed'
+        assert 'expel_name' in ea._modified_fields
+
+    def test_descriptor_fallback(self, mock_workbench):
+        xc = mock_workbench.client()
+        inv = xc.investigations.search(fields('title')).one_or_none()
+        with pytest.raises(ValueError, match='fields'):
+            inv.close_comment
+        # A proxy is fetched by the first attribute read
+        assert xc.expel_alerts.search().one_or_none().investigation.title.startswith('Investigation')
+
+
+class TestTimestamps:
+    def test_parse_timestamp(self):
+        expected = datetime.datetime(2021, 3, 4, 5, 6, 7, 890000, tzinfo=datetime.timezone.utc)
+        assert parse_timestamp('2021-03-04T05:06:07.890Z') == expected
+        assert parse_timestamp('2021-03-04T05:06:07.890+00:00') == expected
+        assert parse_timestamp('2021-03-04T05:06:07.890') == expected
+        assert parse_timestamp('not a timestamp') is None
+        assert parse_timestamps(['2021-03-04T05:06:07.890Z', None, '2021-03-04T05:06:07.890Z', 'x']) == [
+            expected, None, expected, None]
+
+    def test_untyped(self, mock_workbench):
+        ea = mock_workbench.client().expel_alerts.search().one_or_none()
+        assert isinstance(ea.created_at, str)
+
+    def test_typed(self, mock_workbench):
+        xc = mock_workbench.client(typed=True)
+        ea = xc.expel_alerts.search().one_or_none()
+        created = ea.created_at
+        assert created == parse_timestamp(mock_workbench.records('expel_alerts')[0]['attributes']['created_at'])
+        # Decoded once, then kept on the record
+        assert ea._attrs['created_at'] is created
+        assert ea.created_at is created
+        assert isinstance(ea.expel_name, str)
+        assert isinstance(ea.investigation.created_at, datetime.datetime)
+        assert json.loads(ea.to_json())['created_at'] == created.isoformat()
+        assert pickle.loads(pickle.dumps(ea)).created_at == created
+
+    def test_typed_save(self):
+        with MockWorkbench(organizations=1, investigations=1) as wb:
+            xc = wb.client(typed=True)
+            inv = xc.investigations.search().one_or_none()
+            inv.status_updated_at = inv.created_at + datetime.timedelta(days=1)
+            inv.save()
+            assert xc.investigations.get(id=inv.id).status_updated_at == inv.created_at + datetime.timedelta(days=1)